@@ -31,7 +31,10 @@ class ExecutionResult:
     error: Optional[str] = None
 
     def to_dict(self) -> dict:
+        # Carries the wire "type" tag so the EXECUTION broadcast serialises
+        # this dict directly (no merge dict per event)
         return {
+            "type": "EXECUTION",
             "success": self.success,
             "action_id": self.action_id,
             "command": self.command,
@@ -301,8 +304,9 @@ class ActionExecutor:
                 start_y = int(index_tip[1] * screen_height)
                 
                 # Store the NORMALIZED starting position for delta calculations
-                self._text_selection_state["start_pos"] = {"x": index_tip[0], "y": index_tip[1]}
-                self._text_selection_state["current_pos"] = {"x": index_tip[0], "y": index_tip[1]}
+                # (plain floats — meta landmarks may arrive as a numpy array)
+                self._text_selection_state["start_pos"] = {"x": float(index_tip[0]), "y": float(index_tip[1])}
+                self._text_selection_state["current_pos"] = {"x": float(index_tip[0]), "y": float(index_tip[1])}
                 
                 # Move to start position
                 pyautogui.moveTo(start_x, start_y)
@@ -344,7 +348,7 @@ class ActionExecutor:
                     pyautogui.move(dx_pixels, dy_pixels, _pause=False)
                 
                 # Update current position for next frame delta
-                self._text_selection_state["current_pos"] = {"x": index_tip[0], "y": index_tip[1]}
+                self._text_selection_state["current_pos"] = {"x": float(index_tip[0]), "y": float(index_tip[1])}
                 
                 return ExecutionResult(
                     success=True,
@@ -26,7 +26,6 @@ The pipeline loop:
 """
 
 import argparse
-import asyncio
 import json
 import logging
 import sys
@@ -41,7 +40,7 @@ from pipeline.mediapipe_detection import GestureDetector
 from pipeline.gesture_router import GestureRouter
 from pipeline.dtw_matcher import DTWMatcher
 from pipeline.task_mapper import GestureTaskMapper
-from pipeline.websocket_server import WebSocketServer
+from pipeline.websocket_server import WebSocketServer, _dumps, _loads
 from pipeline.recorder import Recorder
 from pipeline.mjpeg_server import MJPEGServer
 from Mapping.action_executor_v2 import ActionExecutor
@@ -70,6 +69,60 @@ def parse_args():
     return p.parse_args()
 
 
+#Frame Grabber
+
+class FrameGrabber:
+    """
+    Reads the camera on a daemon thread, keeping only the newest frame.
+
+    MediaPipe inference takes tens of milliseconds; while the pipeline is busy
+    the camera keeps producing frames, and a serial read→process loop lets
+    capture latency compound. The grabber overwrites a single latest-frame
+    slot under a lock so the pipeline always consumes the freshest frame and
+    stale ones are silently dropped.
+    """
+
+    def __init__(self, cam: cv2.VideoCapture):
+        self._cam     = cam
+        self._lock    = threading.Lock()
+        self._frame   = None
+        self._stopped = False
+        self._thread  = threading.Thread(
+            target=self._loop, daemon=True, name="FrameGrabber"
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def _loop(self):
+        while not self._stopped:
+            # grab() advances the stream cheaply; the expensive decode
+            # (retrieve) only runs for frames the pipeline will consume.
+            if not self._cam.grab():
+                time.sleep(0.05)
+                continue
+            with self._lock:
+                pending = self._frame is not None
+            if pending:
+                continue   # last frame not consumed yet — skip the decode
+            ret, frame = self._cam.retrieve()
+            if not ret:
+                continue
+            with self._lock:
+                self._frame = frame
+
+    def read(self):
+        """Return the newest unseen frame, or None if nothing new arrived yet."""
+        with self._lock:
+            frame = self._frame
+            self._frame = None
+        return frame
+
+    def stop(self):
+        self._stopped = True
+        self._thread.join(timeout=1.0)
+
+
 #Main Pipeline Loop
 
 def run(args):
@@ -97,6 +150,12 @@ def run(args):
     mjpeg = MJPEGServer(port=8767)
     mjpeg.start()
 
+    # The debug overlay is purely for humans — only draw it when the local
+    # preview window is open or an MJPEG client is actually watching
+    detector.preview_needed = (
+        lambda: not args.no_preview or mjpeg.client_count > 0
+    )
+
     # Start HTTP control server (allows extension to check status)
     _stop_signal.clear()
     start_control_server(_stop_signal)
@@ -106,11 +165,16 @@ def run(args):
     # The mapper is passed so UPDATE_BINDING goes through GestureTaskMapper
     _attach_recorder_commands(server, recorder, cfg, mapper)
 
-    #  Camera setup 
+    #  Camera setup
     s = cfg.settings
     cam = cv2.VideoCapture(s.get("camera_index", 0))
+    # Keep the driver-side queue at a single frame so cam.read() always hands
+    # us the newest image instead of stale buffered ones (default is ~4).
+    if not cam.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+        logger.warning("Camera backend ignored CAP_PROP_BUFFERSIZE=1 — frames may lag.")
     cam.set(cv2.CAP_PROP_FRAME_WIDTH,  s.get("camera_width",  1280))
     cam.set(cv2.CAP_PROP_FRAME_HEIGHT, s.get("camera_height", 720))
+    cam.set(cv2.CAP_PROP_FPS,          s.get("camera_fps",    30))
 
     if not cam.isOpened():
         logger.error("Cannot open camera. Check camera_index in settings.")
@@ -123,23 +187,30 @@ def run(args):
     logger.info(f"WebSocket: ws://{cfg.ws_host}:{cfg.ws_port}")
     logger.info("Pipeline running. Press 'q' to quit.")
 
+    # Decouple capture from inference — see FrameGrabber docstring
+    grabber = FrameGrabber(cam)
+    grabber.start()
+
     # ── Main loop ──
     fps_times: list[float] = []
     zero_clients_start_time: float | None = None
 
     try:
         while not _stop_signal.is_set():
-            ret, frame = cam.read()
-            if not ret:
-                logger.warning("Frame capture failed — retrying.")
-                time.sleep(0.05)
+            frame = grabber.read()
+            if frame is None:
+                time.sleep(0.005)   # no new frame yet
                 continue
 
+            # One wall-clock read per frame — reused by the shutdown check
+            # and the FPS overlay below
+            now = time.time()
+
             # Auto-shutdown if Chrome is closed (0 clients for 5 seconds)
             if server.client_count == 0:
                 if zero_clients_start_time is None:
-                    zero_clients_start_time = time.time()
-                elif time.time() - zero_clients_start_time > 5.0:
+                    zero_clients_start_time = now
+                elif now - zero_clients_start_time > 5.0:
                     logger.info("No clients connected for 5 seconds. Shutting down pipeline.")
                     break
             else:
@@ -175,19 +246,16 @@ def run(args):
                 server.broadcast(event)
                 
                 # Broadcast ExecutionResult (what the extension should do)
-                if result.success and result.command:
-                    payload = json.dumps({"type": "EXECUTION", **result.to_dict()})
-                    if server._loop and server._clients:
-                        asyncio.run_coroutine_threadsafe(
-                            server._broadcast_raw(payload), server._loop
-                        )
+                # (client check first — don't serialise for nobody)
+                if result.success and result.command \
+                        and server._loop and server._clients:
+                    server.broadcast_raw(_dumps(result.to_dict()))
 
             # 5. Status heartbeat
             status = "running" if frame_result.hands else "no_hands"
             server.broadcast_status(status)
 
             # 6. FPS overlay + push to MJPEG stream
-            now = time.time()
             fps_times.append(now)
             fps_times = [t for t in fps_times if now - t < 1.0]
             fps = len(fps_times)
@@ -221,6 +289,7 @@ def run(args):
     except KeyboardInterrupt:
         logger.info("Interrupted by user.")
     finally:
+        grabber.stop()
         cam.release()
         cv2.destroyAllWindows()
         detector.close()
@@ -248,7 +317,7 @@ def _attach_recorder_commands(
 
     async def patched_handler(ws, raw):
         try:
-            msg = json.loads(raw)
+            msg = _loads(raw)
         except Exception:
             await original_handler(ws, raw)
             return
@@ -260,7 +329,7 @@ def _attach_recorder_commands(
                 gesture_type   = msg.get("gesture_type", "static"),
                 preferred_hand = msg.get("hand", "Right").capitalize()
             )
-            await ws.send(json.dumps({
+            await ws.send(_dumps({
                 "type": "ACK",
                 "recording_started": True,
                 "gesture_id": msg.get("gesture_id")
@@ -281,7 +350,7 @@ def _attach_recorder_commands(
                 else:
                     cfg.set_binding(gesture_id, task_id)  # fallback
                 logger.info(f"[Mapper] Binding updated: {gesture_id} -> {task_id}")
-                await ws.send(json.dumps({
+                await ws.send(_dumps({
                     "type": "ACK", "binding_updated": True,
                     "gesture_id": gesture_id, "action_id": task_id
                 }))
@@ -291,7 +360,7 @@ def _attach_recorder_commands(
             if gesture_id:
                 cfg.delete_custom_gesture(gesture_id)
                 logger.info(f"[Mapper] Custom gesture deleted: {gesture_id}")
-                await ws.send(json.dumps({
+                await ws.send(_dumps({
                     "type": "ACK", "gesture_deleted": True,
                     "gesture_id": gesture_id
                 }))
@@ -308,7 +377,7 @@ def _attach_recorder_commands(
                         cfg._config.setdefault("bindings", {})[gid] = tid
                 cfg.save()
             logger.info("[Mapper] All built-in bindings reset to factory defaults")
-            await ws.send(json.dumps({"type": "ACK", "bindings_reset": True}))
+            await ws.send(_dumps({"type": "ACK", "bindings_reset": True}))
 
         else:
             await original_handler(ws, raw)
@@ -318,11 +387,8 @@ def _attach_recorder_commands(
 
 def _broadcast_recording_event(server: WebSocketServer, event):
     """Forward a RecordingEvent to all connected clients."""
-    payload = json.dumps(event.to_dict())
     if server._loop and server._clients:
-        asyncio.run_coroutine_threadsafe(
-            server._broadcast_raw(payload), server._loop
-        )
+        server.broadcast_raw(_dumps(event.to_dict()))
 
 
 # Entry Point 
@@ -17,12 +17,18 @@ Usage:
 """
 
 import json
+import os
 import threading
 import time
 import logging
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+try:
+    import orjson          # C JSON codec — much faster on the landmark-heavy config
+except ImportError:
+    orjson = None          # stdlib json fallback
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +41,7 @@ class ConfigManager:
         self._watch_thread: Optional[threading.Thread] = None
         self._watching = False
         self._on_reload_callbacks: list[Callable] = []
+        self._version = 0          # bumped on every mutation/reload (cache key)
 
         self._load()
 
@@ -43,11 +50,12 @@ class ConfigManager:
     def _load(self):
         """Read and parse the JSON file. Thread-safe."""
         try:
-            raw = self._path.read_text(encoding="utf-8")
-            data = json.loads(raw)
+            raw = self._path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             with self._lock:
                 self._config = data
                 self._last_mtime = self._path.stat().st_mtime
+                self._version += 1
             logger.info(f"Config loaded from {self._path}")
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error(f"Failed to load config: {e}")
@@ -57,10 +65,27 @@ class ConfigManager:
         """Write current in-memory config back to disk."""
         with self._lock:
             data = self._config.copy()
-        self._path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            encoding="utf-8"
-        )
+        if orjson is not None:
+            # orjson writes UTF-8 unescaped natively (ensure_ascii=False equivalent)
+            # and serialises the custom-gesture landmark arrays in C
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        # Write to a sibling tempfile and rename atomically so the file watcher,
+        # watchdog /config endpoint, and extension UI never read a half-written
+        # config mid-save.
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        tmp.write_bytes(payload)
+        # Keep the previous config as a hardlink backup — a directory-entry
+        # update, not a data copy — before the atomic swap. Skipped silently
+        # where the filesystem lacks hardlinks; the save itself still proceeds.
+        bak = self._path.with_suffix(self._path.suffix + ".bak")
+        try:
+            bak.unlink(missing_ok=True)
+            os.link(self._path, bak)
+        except OSError:
+            pass
+        os.replace(tmp, self._path)
         # Update _last_mtime so the file watcher doesn't treat our own
         # save() as an external change and trigger a redundant _load().
         with self._lock:
@@ -131,9 +156,17 @@ class ConfigManager:
             for k in keys[:-1]:
                 node = node.setdefault(k, {})
             node[keys[-1]] = value
+            self._version += 1
         if persist:
             self.save()
 
+    # ── Versioning ─────────────────────────────────────────────────────────────
+
+    @property
+    def version(self) -> int:
+        """Monotonic mutation counter — lets consumers key caches off config state."""
+        return self._version
+
     # ── Settings ───────────────────────────────────────────────────────────────
 
     @property
@@ -207,6 +240,17 @@ class ConfigManager:
         self.set("bindings", gesture_id, action_id)
         logger.info(f"Binding updated: {gesture_id} → {action_id}")
 
+    def update_bindings(self, bindings: dict[str, str]):
+        """
+        Batch-apply binding changes with a single version bump and one save.
+        Going through here (rather than poking _config directly) keeps every
+        version-keyed cache — router, mapper, snapshot — in sync.
+        """
+        with self._lock:
+            self._config.setdefault("bindings", {}).update(bindings)
+            self._version += 1
+        self.save()
+
     # ── Custom Gestures ────────────────────────────────────────────────────────
 
     @property
@@ -232,6 +276,7 @@ class ConfigManager:
         with self._lock:
             self._config.get("custom_gestures", {}).pop(gesture_id, None)
             self._config.get("bindings", {}).pop(gesture_id, None)
+            self._version += 1
         self.save()
         logger.info(f"Custom gesture deleted: {gesture_id}")
 
@@ -243,8 +288,23 @@ class ConfigManager:
                 logger.warning(f"Custom gesture not found: {gesture_id}")
                 return
             cg[gesture_id].setdefault("samples", []).append(sample)
+            self._version += 1
         self.save()
 
+    def snapshot_dict(self) -> dict:
+        """
+        All client-facing config sections in one dict, read under a single
+        lock acquisition so the snapshot can't be torn by a concurrent write.
+        """
+        with self._lock:
+            return {
+                "settings": self.settings,
+                "actions":  self.actions,
+                "gestures": self.gestures,
+                "bindings": self.bindings,
+                "custom_gestures": self.custom_gestures,
+            }
+
     # ── Two-Hand Multiplier Config ─────────────────────────────────────────────
 
     @property
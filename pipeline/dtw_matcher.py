@@ -11,6 +11,12 @@ How it works:
     wins, provided it is below the gesture's configured dtw_threshold.
   - For static gestures: compare single 21×3 landmark frames (flattened to 63-d vectors).
   - For dynamic gestures: compare sequences of frames, each frame flattened.
+  - Flattening/normalisation happens exactly once per sequence (cached for
+    stored templates, one vectorised pass for live data) — never inside the
+    O(n×m) DTW recurrence itself.
+  - Static matching scores all templates in one batched pass. ANN-style
+    prefilters (fingertip signatures, bounding boxes) only pay off at
+    hundreds of templates; a user records a handful, so none are used.
 
 Dependencies:
   - numpy only (no external DTW library required; we implement a standard
@@ -30,8 +36,69 @@ import numpy as np
 
 from pipeline.config_manager import ConfigManager
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 logger = logging.getLogger(__name__)
 
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _dtw_core(a: np.ndarray, b: np.ndarray, w: int,
+                  prev: np.ndarray, curr: np.ndarray) -> float:
+        """
+        Fused DTW over two (n, 63) float32 sequences: the per-cell Euclidean
+        distance (explicit summed-squares loop — Numba vectorises the 63-wide
+        reduction) and the DP recurrence run in one pass, with two rolling
+        rows instead of the full (n, m) matrix, so no local-distance matrix
+        is ever materialised. Only cells within the Sakoe-Chiba band
+        |i - j| <= w are evaluated; out-of-band cells stay +inf, which the
+        min() recurrence skips naturally. prev/curr are caller-provided
+        scratch rows of length >= m, reused across calls to avoid per-call
+        allocation.
+        """
+        n, m = a.shape[0], b.shape[0]
+        d = a.shape[1]
+        inf = np.float32(np.inf)
+        prev[:m] = inf
+        hi0 = min(m - 1, w)
+        for j in range(hi0 + 1):
+            s = 0.0
+            for k in range(d):
+                diff = a[0, k] - b[j, k]
+                s += diff * diff
+            dist = np.sqrt(s)
+            prev[j] = dist if j == 0 else dist + prev[j - 1]
+        for i in range(1, n):
+            lo = max(0, i - w)
+            hi = min(m - 1, i + w)
+            curr[:m] = inf
+            for j in range(lo, hi + 1):
+                s = 0.0
+                for k in range(d):
+                    diff = a[i, k] - b[j, k]
+                    s += diff * diff
+                dist = np.sqrt(s)
+                if j == 0:
+                    curr[0] = dist + prev[0]
+                else:
+                    best = prev[j]
+                    if curr[j - 1] < best:
+                        best = curr[j - 1]
+                    if prev[j - 1] < best:
+                        best = prev[j - 1]
+                    curr[j] = dist + best
+            prev, curr = curr, prev
+        return prev[m - 1]
+
+    # Warm the JIT at import so the first live match doesn't pay compile latency
+    _dtw_core(np.zeros((2, 63), dtype=np.float32), np.zeros((2, 63), dtype=np.float32),
+              5, np.empty(2, dtype=np.float32), np.empty(2, dtype=np.float32))
+else:
+    _dtw_core = None
+
 class DTWMatcher:
     """
     Matches live landmark data against stored custom gesture samples using DTW.
@@ -39,6 +106,26 @@ class DTWMatcher:
 
     def __init__(self, config: ConfigManager):
         self.cfg = config
+        # Static templates pre-flattened into one contiguous (K, 63) float32
+        # matrix (K = total samples across all enabled static gestures), with
+        # per-gesture row ranges alongside. Rebuilt lazily whenever the config
+        # version counter moves — match_static then scores every sample in a
+        # handful of vectorised ops instead of re-parsing each sample's JSON
+        # landmark list every frame.
+        self._static_matrix: Optional[np.ndarray] = None
+        self._static_groups: list[tuple[str, float, int, int]] = []
+        self._static_version = -1
+        # Dynamic templates likewise: each stored sample pre-flattened and
+        # row-normalised once into a contiguous (T, 63) float32 array, so
+        # match_dynamic hands DTW dense buffers instead of re-parsing nested
+        # JSON lists per sample per call.
+        self._dynamic_groups: list[tuple[str, float, list[np.ndarray]]] = []
+        self._dynamic_version = -1
+        # DP row scratch for the jitted DTW kernel, grown on demand and
+        # reused across every template comparison instead of allocating two
+        # fresh rows per call at frame rate. Not thread-safe — DTW runs only
+        # on the pipeline loop thread.
+        self._dtw_rows: Optional[np.ndarray] = None
         config.on_reload(lambda _: logger.info("DTWMatcher: config reloaded."))
 
     # Public API
@@ -48,8 +135,68 @@ class DTWMatcher:
         Compare a single live frame (21×3) against all static custom gestures.
         Returns the gesture_id of the best match, or None.
         """
+        matrix, groups = self._static_templates()
+        if matrix is None:
+            return None
+
         live_vec = self._flatten(live_landmarks)
-        return self._match_against_customs(live_vec, gesture_type="static")
+        # Squared distances to every stored sample in one pass; sqrt applied
+        # vectorised afterwards so per-sample scores stay identical to a
+        # per-sample np.linalg.norm loop. At the template counts this app
+        # sees (a few gestures × ~6 samples) this single batched pass is
+        # cheaper than any per-template early-abandon loop — and the score
+        # is a mean over each gesture's samples, so every row is needed
+        # anyway.
+        diffs = matrix - live_vec
+        dists = np.einsum("ij,ij->i", diffs, diffs)
+        np.sqrt(dists, out=dists)
+
+        best_id    = None
+        best_score = float("inf")
+        for gid, threshold, start, end in groups:
+            mean_score = float(dists[start:end].mean())
+            logger.debug("DTW %s: mean=%.4f threshold=%s", gid, mean_score, threshold)
+            if mean_score < threshold and mean_score < best_score:
+                best_score = mean_score
+                best_id    = gid
+        return best_id
+
+    def _static_templates(self):
+        """Return (matrix, groups), rebuilding the cache if the config changed."""
+        if self._static_version != self.cfg.version:
+            rows: list[np.ndarray] = []
+            groups: list[tuple[str, float, int, int]] = []
+            for gid, gesture in self.cfg.custom_gestures.items():
+                if not gesture.get("enabled", True):
+                    continue
+                if gesture.get("type") != "static":
+                    continue
+                start = len(rows)
+                for sample in gesture.get("samples", []):
+                    stored_lm = sample.get("landmarks")
+                    if stored_lm is None:
+                        continue
+                    try:
+                        vec = self._flatten(stored_lm)
+                    except Exception as e:
+                        logger.warning(f"Bad static sample for {gid}: {e}")
+                        continue
+                    # Ragged samples (hand-edited config, unvalidated WS
+                    # payloads) would blow up the np.stack below — skip them
+                    # so one bad sample can't take out match_static.
+                    if vec.shape != (63,):
+                        logger.warning(f"Bad static sample for {gid}: expected 63 values, got {vec.size}")
+                        continue
+                    rows.append(vec)
+                if len(rows) > start:
+                    threshold = gesture.get("dtw_threshold", 0.15)
+                    groups.append((gid, threshold, start, len(rows)))
+            self._static_matrix = np.stack(rows) if rows else None
+            self._static_groups = groups
+            # Committed only after a successful rebuild so a failure above
+            # retries next call instead of serving the previous matrix forever
+            self._static_version = self.cfg.version
+        return self._static_matrix, self._static_groups
 
     def match_dynamic(self, live_sequence: list[np.ndarray]) -> Optional[str]:
         """
@@ -59,97 +206,128 @@ class DTWMatcher:
         """
         if len(live_sequence) < 3:
             return None
-        live_seq = [self._flatten(f) for f in live_sequence]
-        return self._match_against_customs(live_seq, gesture_type="dynamic")
-
-    #Core Matching
+        groups = self._dynamic_templates()
+        if not groups:
+            return None
 
-    def _match_against_customs(
-        self,
-        live_data,               # np.ndarray (static) or list[np.ndarray] (dynamic)
-        gesture_type: str        # "static" or "dynamic"
-    ) -> Optional[str]:
+        live_seq = self._flatten_sequence(live_sequence)
 
         best_id    = None
         best_score = float("inf")
-
-        for gid, gesture in self.cfg.custom_gestures.items():
-            if not gesture.get("enabled", True):
-                continue
-            if gesture.get("type") != gesture_type:
-                continue
-
-            samples = gesture.get("samples", [])
-            if not samples:
-                continue
-
-            threshold = gesture.get("dtw_threshold", 0.15)
-            scores = []
-
-            for sample in samples:
-                stored_lm = sample.get("landmarks")
-                if stored_lm is None:
-                    continue
-                try:
-                    if gesture_type == "static":
-                        stored_vec = self._flatten(np.array(stored_lm))
-                        score = self._euclidean(live_data, stored_vec)
-                    else:
-                        stored_seq = [self._flatten(np.array(f)) for f in stored_lm]
-                        score = self._dtw(live_data, stored_seq)
-                    scores.append(score)
-                except Exception as e:
-                    logger.warning(f"DTW error for {gid}: {e}")
-                    continue
-
-            if not scores:
-                continue
-
-            mean_score = np.mean(scores)
-            logger.debug(f"DTW {gid}: mean={mean_score:.4f} threshold={threshold}")
-
+        for gid, threshold, stored_seqs in groups:
+            scores = [self._dtw(live_seq, stored) for stored in stored_seqs]
+            mean_score = float(np.mean(scores))
+            logger.debug("DTW %s: mean=%.4f threshold=%s", gid, mean_score, threshold)
             if mean_score < threshold and mean_score < best_score:
                 best_score = mean_score
                 best_id    = gid
-
         return best_id
 
+    def _dynamic_templates(self) -> list[tuple[str, float, list[np.ndarray]]]:
+        """Return dynamic template groups, rebuilding the cache if the config changed."""
+        if self._dynamic_version != self.cfg.version:
+            groups: list[tuple[str, float, list[np.ndarray]]] = []
+            for gid, gesture in self.cfg.custom_gestures.items():
+                if not gesture.get("enabled", True):
+                    continue
+                if gesture.get("type") != "dynamic":
+                    continue
+                seqs: list[np.ndarray] = []
+                for sample in gesture.get("samples", []):
+                    stored_lm = sample.get("landmarks")
+                    if stored_lm is None:
+                        continue
+                    try:
+                        seqs.append(self._flatten_sequence(stored_lm))
+                    except Exception as e:
+                        logger.warning(f"Bad dynamic sample for {gid}: {e}")
+                if seqs:
+                    groups.append((gid, gesture.get("dtw_threshold", 0.15), seqs))
+            self._dynamic_groups = groups
+            self._dynamic_version = self.cfg.version
+        return self._dynamic_groups
+
     # DTW Implementation 
 
-    @staticmethod
-    def _dtw(seq_a: list[np.ndarray], seq_b: list[np.ndarray]) -> float:
+    def _dtw(self, seq_a: list[np.ndarray], seq_b: list[np.ndarray]) -> float:
         """
         Standard O(n×m) DTW between two sequences of equal-dimension vectors.
         Returns the normalised DTW distance (divided by n+m to be scale-invariant).
-        """
-        n, m = len(seq_a), len(seq_b)
-        # Cost matrix
-        cost = np.full((n, m), float("inf"))
-        cost[0, 0] = np.linalg.norm(seq_a[0] - seq_b[0])
-
-        for i in range(1, n):
-            cost[i, 0] = cost[i-1, 0] + np.linalg.norm(seq_a[i] - seq_b[0])
-        for j in range(1, m):
-            cost[0, j] = cost[0, j-1] + np.linalg.norm(seq_a[0] - seq_b[j])
 
+        With numba the whole thing runs inside the fused _dtw_core kernel;
+        otherwise the full pairwise local-distance matrix is computed in one
+        vectorised NumPy pass (||a_i - b_j||² = |a_i|² + |b_j|² - 2·a_i·b_j),
+        so the DP loop only does scalar min/add per cell instead of a
+        np.linalg.norm call.
+        """
+        # C-contiguous float32 so both the jitted kernel and the BLAS matmul
+        # fallback work on dense rows rather than a strided copy.
+        a = np.ascontiguousarray(seq_a, dtype=np.float32)
+        b = np.ascontiguousarray(seq_b, dtype=np.float32)
+        n, m = len(a), len(b)
+
+        # Sakoe-Chiba band half-width: realistic time-warps between samples
+        # of the same gesture stay within a few frames, so cells far off the
+        # diagonal are never part of a plausible alignment. Wide enough to
+        # cover the length mismatch so the end cell is always reachable.
+        w = max(5, abs(n - m) + 2)
+
+        if _dtw_core is not None:
+            if self._dtw_rows is None or self._dtw_rows.shape[1] < m:
+                self._dtw_rows = np.empty((2, max(m, 64)), dtype=np.float32)
+            return float(
+                _dtw_core(a, b, w, self._dtw_rows[0], self._dtw_rows[1])
+            ) / (n + m)
+
+        # Pairwise Euclidean distances, fully vectorised
+        local = (
+            np.einsum("ij,ij->i", a, a)[:, None]
+            + np.einsum("ij,ij->i", b, b)[None, :]
+            - 2.0 * (a @ b.T)
+        )
+        np.maximum(local, 0.0, out=local)   # clamp negative rounding error
+        np.sqrt(local, out=local)
+        # Same band on the fallback path: out-of-band cells become +inf,
+        # which the min() recurrence (and the edge cumsums) skip naturally
+        if n > w + 1 or m > w + 1:
+            off_diag = np.abs(np.arange(n)[:, None] - np.arange(m)[None, :])
+            local[off_diag > w] = np.inf
+
+        # Accumulate the DP in place over the local-distance matrix
+        cost = local
+        np.cumsum(cost[0, :], out=cost[0, :])
+        np.cumsum(cost[:, 0], out=cost[:, 0])
         for i in range(1, n):
+            prev_row = cost[i - 1]
+            row = cost[i]
             for j in range(1, m):
-                local = np.linalg.norm(seq_a[i] - seq_b[j])
-                cost[i, j] = local + min(cost[i-1, j], cost[i, j-1], cost[i-1, j-1])
+                row[j] += min(prev_row[j], row[j - 1], prev_row[j - 1])
 
-        return float(cost[n-1, m-1]) / (n + m)
-
-    @staticmethod
-    def _euclidean(a: np.ndarray, b: np.ndarray) -> float:
-        """Simple Euclidean distance for static single-frame comparison."""
-        return float(np.linalg.norm(a - b))
+        return float(cost[n - 1, m - 1]) / (n + m)
 
     @staticmethod
     def _flatten(landmarks) -> np.ndarray:
         """Flatten (21, 3) → (63,) and L2-normalise for scale invariance."""
-        vec = np.array(landmarks).flatten().astype(np.float32)
-        norm = np.linalg.norm(vec)
-        return vec / (norm + 1e-6)
+        # Single float32 conversion + reshape (no intermediate float64 copy)
+        vec = np.asarray(landmarks, dtype=np.float32).reshape(-1)
+        # dot + one sqrt, then a scalar-reciprocal multiply — skips
+        # np.linalg.norm's generic machinery and the division broadcast
+        norm = float(np.sqrt(vec @ vec))
+        return vec * (1.0 / (norm + 1e-6))
+
+    @staticmethod
+    def _flatten_sequence(frames) -> np.ndarray:
+        """
+        Flatten a sequence of (21, 3) frames to one contiguous (T, 63) float32
+        array with each row L2-normalised — the same maths as _flatten applied
+        per frame, in a single vectorised pass.
+        """
+        seq = np.asarray(frames, dtype=np.float32).reshape(len(frames), -1)
+        # Row squared-sums via einsum, one vectorised sqrt over T values,
+        # then multiply by the reciprocal — same maths as per-row
+        # np.linalg.norm division without its intermediate buffers
+        norms = np.sqrt(np.einsum("ij,ij->i", seq, seq))[:, None]
+        return seq * (1.0 / (norms + 1e-6))
 
     # Sample Recording
 
@@ -5,7 +5,7 @@ gesture_detector_fixed.py
 import math
 import time
 import logging
-from collections import deque, Counter
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -14,6 +14,7 @@ import mediapipe as mp
 import numpy as np
 
 from pipeline.config_manager import ConfigManager
+from pipeline.mediapipe_detection import _MajorityBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +25,7 @@ logger = logging.getLogger(__name__)
 class HandResult:
     """Processed result for a single hand in one frame."""
     label: str                          # "Left" or "Right"
-    landmarks: np.ndarray               # shape (21, 3) normalised 0–1
+    landmarks: np.ndarray               # (21, 3) float32, normalised 0–1
     static_gesture: Optional[str]       # e.g. "FIST", "PALM", "PEACE" or None
     dynamic_gesture: Optional[str]      # e.g. "SWIPE_LEFT", "WAVE" or None
     palm_facing: bool                   # True = palm faces camera
@@ -61,6 +62,11 @@ class GestureDetector:
     tracking, and pinch distance.
     """
 
+    # Pointing-direction LUT indexed by quantised 45° sector (offset half a
+    # sector so RIGHT straddles 0°); sector 7 keeps the comparison chain's
+    # uncovered [292.5°, 337.5°) gap
+    _POINT_DIRS = ("RIGHT", "UP", "UP", "LEFT", "LEFT", "DOWN", "DOWN", "UNKNOWN")
+
     # MediaPipe landmark indices
     WRIST = 0
     THUMB_CMC, THUMB_MCP, THUMB_IP, THUMB_TIP = 1, 2, 3, 4
@@ -78,14 +84,14 @@ class GestureDetector:
         dbuf = s.get("dynamic_buffer_size", 5)
         hist = s.get("position_history_size", 25)
 
-        # Per-hand buffers
-        self._static_buf:   dict[str, deque] = {
-            "Left":  deque(maxlen=buf),
-            "Right": deque(maxlen=buf)
+        # Per-hand buffers (incremental majority tally — no per-frame Counter)
+        self._static_buf:   dict[str, _MajorityBuffer] = {
+            "Left":  _MajorityBuffer(maxlen=buf),
+            "Right": _MajorityBuffer(maxlen=buf)
         }
-        self._dynamic_buf:  dict[str, deque] = {
-            "Left":  deque(maxlen=dbuf),
-            "Right": deque(maxlen=dbuf)
+        self._dynamic_buf:  dict[str, _MajorityBuffer] = {
+            "Left":  _MajorityBuffer(maxlen=dbuf),
+            "Right": _MajorityBuffer(maxlen=dbuf)
         }
         self._pos_history:  dict[str, deque] = {
             "Left":  deque(maxlen=hist),
@@ -96,8 +102,24 @@ class GestureDetector:
             "Right": deque(maxlen=6)
         }
 
+        # Persistent RGB buffer (allocated lazily on first frame) so cvtColor
+        # writes in place instead of allocating HxWx3 every frame; the
+        # horizontal flip itself mirrors the capture buffer in place
+        self._rgb_buf: Optional[np.ndarray] = None
+        # MediaPipe resizes internally to ~192-256px anyway, so frames wider
+        # than inference_width are shrunk before process(); landmarks are
+        # normalised so nothing downstream needs rescaling
+        self._infer_width = int(self.cfg.settings.get("inference_width", 640))
+        self._infer_buf: Optional[np.ndarray] = None
+
         # Two-hand combo patterns (from config)
         self._combo_patterns = self._build_combo_patterns()
+        # Inverted index for _detect_combo: one dict get per frame instead of
+        # scanning every pattern. setdefault keeps first-wins semantics if
+        # two combos ever claim the same (left, right) pair.
+        self._combo_lookup: dict = {}
+        for combo_id, pair in self._combo_patterns.items():
+            self._combo_lookup.setdefault(pair, combo_id)
 
         # Register reload callback
         config.on_reload(lambda _: self._refresh_on_reload())
@@ -113,11 +135,22 @@ class GestureDetector:
             model_complexity=s.get("model_complexity", 1)
         )
         self._mp_draw = mp.solutions.drawing_utils
+        # HAND_CONNECTIONS as a (N, 2) index array, built once — the skeleton
+        # is drawn with a single cv2.polylines call over all bones
+        self._connections = np.array(
+            sorted(self._mp_hands.HAND_CONNECTIONS), dtype=np.intp
+        )
         logger.info("MediaPipe Hands initialised.")
 
     def _refresh_on_reload(self):
         """Called when config file changes while pipeline is running."""
         self._combo_patterns = self._build_combo_patterns()
+        # Inverted index for _detect_combo: one dict get per frame instead of
+        # scanning every pattern. setdefault keeps first-wins semantics if
+        # two combos ever claim the same (left, right) pair.
+        self._combo_lookup: dict = {}
+        for combo_id, pair in self._combo_patterns.items():
+            self._combo_lookup.setdefault(pair, combo_id)
         logger.info("Detector refreshed from config.")
 
     def _build_combo_patterns(self):
@@ -153,8 +186,20 @@ class GestureDetector:
         """
         Main entry point. Takes a raw BGR frame, returns (annotated_frame, FrameResult).
         """
-        frame = cv2.flip(frame, 1)
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        cv2.flip(frame, 1, dst=frame)   # horizontal flip is safe in place
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        rgb = self._rgb_buf
+        h, w = rgb.shape[:2]
+        if 0 < self._infer_width < w:
+            iw = self._infer_width
+            ih = round(h * iw / w)
+            if self._infer_buf is None or self._infer_buf.shape[:2] != (ih, iw):
+                self._infer_buf = np.empty((ih, iw, 3), dtype=np.uint8)
+            cv2.resize(rgb, (iw, ih), dst=self._infer_buf,
+                       interpolation=cv2.INTER_AREA)
+            rgb = self._infer_buf
         results = self._hands.process(rgb)
 
         frame_result = FrameResult()
@@ -166,15 +211,17 @@ class GestureDetector:
                 label      = handedness.classification[0].label   # "Left" / "Right"
                 confidence = handedness.classification[0].score
 
-                # Draw skeleton
-                color = (0, 255, 0) if label == "Left" else (255, 0, 0)
-                self._mp_draw.draw_landmarks(
-                    frame, hand_lms, self._mp_hands.HAND_CONNECTIONS,
-                    self._mp_draw.DrawingSpec(color=color, thickness=2, circle_radius=2),
-                    self._mp_draw.DrawingSpec(color=color, thickness=2)
-                )
+                # Single fromiter pass over the protobuf instead of building a
+                # 21-element list-of-lists per hand per frame
+                landmarks = np.fromiter(
+                    (c for lm in hand_lms.landmark for c in (lm.x, lm.y, lm.z)),
+                    dtype=np.float32, count=63,
+                ).reshape(21, 3)
 
-                landmarks = np.array([[lm.x, lm.y, lm.z] for lm in hand_lms.landmark])
+                # Draw skeleton from the array: one batched polylines call
+                # instead of draw_landmarks' per-bone loop
+                color = (0, 255, 0) if label == "Left" else (255, 0, 0)
+                self._draw_skeleton(frame, landmarks, color)
                 hand_result = self._process_hand(landmarks, label, confidence)
                 frame_result.hands[label] = hand_result
 
@@ -195,6 +242,14 @@ class GestureDetector:
     def close(self):
         self._hands.close()
 
+    def _draw_skeleton(self, frame: np.ndarray, landmarks: np.ndarray, color: tuple):
+        """Draw the hand skeleton from a (21,3) landmark array."""
+        h, w = frame.shape[:2]
+        pts = (landmarks[:, :2] * (w, h)).astype(np.int32)
+        cv2.polylines(frame, pts[self._connections], False, color, 2)
+        for x, y in pts:
+            cv2.circle(frame, (int(x), int(y)), 2, color, 2)
+
     # ── Per-Hand Processing ───────────────────────────────────────────────
 
     def _process_hand(
@@ -205,8 +260,14 @@ class GestureDetector:
     ) -> HandResult:
 
         palm_facing   = self._is_palm_facing(landmarks, label)
-        static_raw    = self._detect_static(landmarks, palm_facing, label)
-        finger_count  = self._count_extended_fingers(landmarks)
+        # Each finger's angles are computed once; _detect_static and the
+        # finger count both consume the same extension tuple
+        ext = tuple(
+            self._is_finger_extended(landmarks, f)
+            for f in ("thumb", "index", "middle", "ring", "pinky")
+        )
+        static_raw    = self._detect_static(landmarks, palm_facing, label, ext)
+        finger_count  = sum(ext)
         pinch_dist    = self._pinch_distance(landmarks)
         velocity, is_stationary = self._compute_velocity(landmarks, label)
 
@@ -224,7 +285,7 @@ class GestureDetector:
             self._dynamic_buf[label].append(raw_dyn)
             # Require only 2 consistent frames (was 4) to fire dynamic gesture
             if len(self._dynamic_buf[label]) >= 2:
-                dynamic_gesture = Counter(self._dynamic_buf[label]).most_common(1)[0][0]
+                dynamic_gesture = self._dynamic_buf[label].majority()
         else:
             # Only clear dynamic buffer if no motion detected
             if not raw_dyn and len(self._pos_history[label]) >= 20:
@@ -261,32 +322,27 @@ class GestureDetector:
             self._angle(landmarks[pip], landmarks[dip], landmarks[tip]) > 140
         )
 
-    def _count_extended_fingers(self, landmarks: np.ndarray) -> int:
-        """Return 0–5 count of extended fingers, thumb included."""
-        fingers = ["thumb", "index", "middle", "ring", "pinky"]
-        return sum(self._is_finger_extended(landmarks, f) for f in fingers)
-
     # ── Palm Facing ───────────────────────────────────────────────────────
 
     def _is_palm_facing(self, landmarks: np.ndarray, handedness: str) -> bool:
-        wrist     = np.array(landmarks[self.WRIST])
-        index_mcp = np.array(landmarks[self.INDEX_MCP])
-        pinky_mcp = np.array(landmarks[self.PINKY_MCP])
-        normal    = np.cross(index_mcp - wrist, pinky_mcp - wrist)
-        facing    = normal[2] > 0
+        # Only the z-component of the palm normal is tested, so compute it
+        # directly with four scalar multiplies — no np.array re-wrapping and
+        # no full np.cross on boxed 3-vectors
+        w = landmarks[self.WRIST]
+        i = landmarks[self.INDEX_MCP]
+        p = landmarks[self.PINKY_MCP]
+        normal_z = (i[0] - w[0]) * (p[1] - w[1]) - (i[1] - w[1]) * (p[0] - w[0])
+        facing = bool(normal_z > 0)
         if handedness == "Left":
             facing = not facing
         return facing
 
     # ── Static Gesture Detection ──────────────────────────────────────────
 
-    def _detect_static(self, lm: np.ndarray, palm_facing: bool, handedness: str) -> str:
-        t = self._is_finger_extended(lm, "thumb")
-        i = self._is_finger_extended(lm, "index")
-        m = self._is_finger_extended(lm, "middle")
-        r = self._is_finger_extended(lm, "ring")
-        p = self._is_finger_extended(lm, "pinky")
-        n = sum([t, i, m, r, p])
+    def _detect_static(self, lm: np.ndarray, palm_facing: bool,
+                       handedness: str, ext: tuple) -> str:
+        t, i, m, r, p = ext
+        n = sum(ext)
 
         if n == 0:
             return "FIST"
@@ -309,20 +365,12 @@ class GestureDetector:
         if n == 5:
             return "PALM"
         if i:
-            direction = np.array(lm[self.INDEX_TIP]) - np.array(lm[self.WRIST])
-            dx, dy = direction[0], direction[1]
-            angle  = math.degrees(math.atan2(-dy, dx)) % 360
+            dx = lm[self.INDEX_TIP][0] - lm[self.WRIST][0]
+            dy = lm[self.INDEX_TIP][1] - lm[self.WRIST][1]
+            sector = int((math.degrees(math.atan2(-dy, dx)) % 360 + 22.5) // 45)
             if not palm_facing:
-                angle = (angle + 180) % 360
-            half = 22.5
-            if angle >= 360 - half or angle < half:
-                return "RIGHT"
-            elif half <= angle < 90 + half:
-                return "UP"
-            elif 90 + half <= angle < 180 + half:
-                return "LEFT"
-            elif 180 + half <= angle < 270 + half:
-                return "DOWN"
+                sector += 4   # the 180° palm flip is exactly four sectors
+            return self._POINT_DIRS[sector % 8]
         return "UNKNOWN"
 
     # ── Dynamic Gesture Detection ─────────────────────────────────────────
@@ -333,7 +381,7 @@ class GestureDetector:
         positions = list(pos_history)
         dx = positions[-1][0] - positions[0][0]
         dy = positions[-1][1] - positions[0][1]
-        total = math.sqrt(dx**2 + dy**2)
+        total = math.hypot(dx, dy)
         path  = sum(
             math.sqrt((positions[i][0]-positions[i-1][0])**2 +
                       (positions[i][1]-positions[i-1][1])**2)
@@ -369,10 +417,7 @@ class GestureDetector:
         rg = hands["Right"].static_gesture
         if not lg or not rg:
             return None
-        for combo_id, (l_pat, r_pat) in self._combo_patterns.items():
-            if lg == l_pat and rg == r_pat:
-                return combo_id
-        return None
+        return self._combo_lookup.get((lg, rg))
 
     # ── Velocity / Stationarity ───────────────────────────────────────────
 
@@ -384,10 +429,9 @@ class GestureDetector:
         hist.append(wrist_pos)
         if len(hist) < 2:
             return 0.0, True
-        velocity = math.sqrt(
-            (hist[-1][0] - hist[-2][0])**2 +
-            (hist[-1][1] - hist[-2][1])**2
-        )
+        # hypot: one C call, no PyNumber pow dispatch, better conditioning
+        velocity = math.hypot(hist[-1][0] - hist[-2][0],
+                              hist[-1][1] - hist[-2][1])
         is_stationary = velocity < STATIONARY_VELOCITY_THRESHOLD
         return velocity, is_stationary
 
@@ -399,19 +443,23 @@ class GestureDetector:
     # ── Smoothing ─────────────────────────────────────────────────────────
 
     @staticmethod
-    def _smooth_gesture(gesture: Optional[str], buf: deque) -> Optional[str]:
+    def _smooth_gesture(gesture: Optional[str], buf: _MajorityBuffer) -> Optional[str]:
         if gesture is None or gesture == "UNKNOWN":
             return None
         buf.append(gesture)
         if len(buf) >= 3:
-            return Counter(buf).most_common(1)[0][0]
+            return buf.majority()
         return gesture
 
     # ── Math Helpers ──────────────────────────────────────────────────────
 
     @staticmethod
     def _dist(a, b) -> float:
-        return math.sqrt(sum((x - y)**2 for x, y in zip(a, b)))
+        # Unrolled 3-vector distance — no zip/generator machinery per call
+        dx = a[0] - b[0]
+        dy = a[1] - b[1]
+        dz = a[2] - b[2]
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
 
     @staticmethod
     def _angle(p1, p2, p3) -> float:
@@ -18,9 +18,11 @@ ActionEvent is a simple dataclass that the WebSocketServer serialises to JSON.
 
 import logging
 import time
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
+
 from pipeline.config_manager import ConfigManager
 from pipeline.mediapipe_detection import FrameResult, HandResult
 from pipeline.dtw_matcher import DTWMatcher
@@ -30,7 +32,7 @@ logger = logging.getLogger(__name__)
 
 #  ActionEvent 
 
-@dataclass
+@dataclass(slots=True)
 class ActionEvent:
     """
     A fully resolved action ready to send over WebSocket.
@@ -45,7 +47,67 @@ class ActionEvent:
     meta:        dict        = field(default_factory=dict)  # extra data (pinch coords, etc.)
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Hand-rolled instead of dataclasses.asdict — asdict deep-copies meta
+        # (which can hold a landmark ndarray) on every emitted event.
+        # Includes the wire "type" tag so broadcast() can serialise this dict
+        # directly without a second merge dict (same shape as
+        # RecordingEvent.to_dict).
+        return {
+            "type":       "ACTION",
+            "action_id":  self.action_id,
+            "gesture_id": self.gesture_id,
+            "hand":       self.hand,
+            "magnitude":  self.magnitude,
+            "repeatable": self.repeatable,
+            "timestamp":  self.timestamp,
+            "meta":       self.meta,
+        }
+
+
+# Landmark Ring Buffer
+
+class _LandmarkRing:
+    """
+    Fixed-capacity ring of (21, 3) landmark frames backed by one preallocated
+    ndarray. Replaces deque-of-ndarrays for the per-hand motion history:
+    append() is an in-place row copy (no per-frame allocation) and sequence()
+    hands DTW a single contiguous float32 array instead of a list of frames.
+
+    Frames are stored as int16 fixed-point (coordinate × 32767). MediaPipe
+    landmarks are normalised to roughly [0, 1], so the quantisation step of
+    ~3e-5 is far below sensor jitter while halving the ring's cache footprint
+    versus float32. sequence() dequantises back to float32 for DTW.
+    """
+
+    __slots__ = ("_buf", "_idx", "_count")
+
+    _SCALE = 32767.0
+
+    def __init__(self, maxlen: int = 30):
+        self._buf = np.empty((maxlen, 21, 3), dtype=np.int16)
+        self._idx = 0
+        self._count = 0
+
+    def append(self, landmarks: np.ndarray):
+        # Clip before the int16 cast — x/y can slightly overshoot [0, 1] when
+        # the hand leaves frame, and unsafe casts would wrap instead
+        self._buf[self._idx] = np.clip(
+            landmarks * self._SCALE, -32768.0, self._SCALE
+        )
+        self._idx = (self._idx + 1) % len(self._buf)
+        self._count = min(self._count + 1, len(self._buf))
+
+    def sequence(self) -> np.ndarray:
+        """Frames in chronological order, oldest first. Shape (count, 21, 3)."""
+        if self._count < len(self._buf):
+            frames = self._buf[:self._count]
+        else:
+            # Full ring: oldest frame sits at the write index
+            frames = np.concatenate((self._buf[self._idx:], self._buf[:self._idx]))
+        return frames.astype(np.float32) * (1.0 / self._SCALE)
+
+    def __len__(self) -> int:
+        return self._count
 
 
 # ultiplier State
@@ -64,42 +126,55 @@ class MultiplierTracker:
     def __init__(self, hold_duration: float = 0.5, max_fingers: int = 5):
         self.hold_duration  = hold_duration
         self.max_fingers    = max_fingers
-        self._hold_start:   dict[str, Optional[float]] = {"Left": None, "Right": None}
-        self._multiplier:   dict[str, Optional[int]]   = {"Left": None, "Right": None}
-
-    def update(self, label: str, is_stationary: bool, finger_count: int) -> Optional[int]:
+        # Scalar slots per hand (not dicts) — update() runs twice per frame,
+        # so plain attribute access beats four hash lookups per call
+        self._hold_start_l: Optional[float] = None
+        self._hold_start_r: Optional[float] = None
+        self._multiplier_l: Optional[int]   = None
+        self._multiplier_r: Optional[int]   = None
+
+    def update(
+        self, label: str, is_stationary: bool, finger_count: int,
+        now: Optional[float] = None,
+    ) -> Optional[int]:
         """
         Call every frame for each detected hand.
+        `now` lets the caller share one time.time() read across both hands.
         Returns the locked multiplier for this hand if active, else None.
         """
+        if now is None:
+            now = time.time()
+        left = label == "Left"
+        hold_start = self._hold_start_l if left else self._hold_start_r
+        multiplier = self._multiplier_l if left else self._multiplier_r
+
         if is_stationary:
-            if self._hold_start[label] is None:
-                self._hold_start[label] = time.time()
-
-            elapsed = time.time() - self._hold_start[label]
-            if elapsed >= self.hold_duration and self._multiplier[label] is None:
-                self._multiplier[label] = min(finger_count, self.max_fingers)
-                logger.info(
-                    f"Multiplier locked: {label} hand â†’ {self._multiplier[label]} fingers"
-                )
+            if hold_start is None:
+                hold_start = now
+            if now - hold_start >= self.hold_duration and multiplier is None:
+                multiplier = min(finger_count, self.max_fingers)
+                logger.info(f"Multiplier locked: {label} hand → {multiplier} fingers")
         else:
-            # Hand moved â€” clear multiplier and timer
-            if self._multiplier[label] is not None:
+            # Hand moved — clear multiplier and timer
+            if multiplier is not None:
                 logger.info(f"Multiplier released: {label} hand")
-            self._hold_start[label]  = None
-            self._multiplier[label]  = None
+            hold_start = None
+            multiplier = None
 
-        return self._multiplier[label]
+        if left:
+            self._hold_start_l, self._multiplier_l = hold_start, multiplier
+        else:
+            self._hold_start_r, self._multiplier_r = hold_start, multiplier
+        return multiplier
 
     def get_multiplier_for_other_hand(self, swiping_hand: str) -> int:
         """Return the locked multiplier from the non-swiping hand, defaulting to 1."""
-        other = "Right" if swiping_hand == "Left" else "Left"
-        return self._multiplier.get(other) or 1
+        other = self._multiplier_r if swiping_hand == "Left" else self._multiplier_l
+        return other or 1
 
     def clear(self):
-        for side in ("Left", "Right"):
-            self._hold_start[side] = None
-            self._multiplier[side] = None
+        self._hold_start_l = self._hold_start_r = None
+        self._multiplier_l = self._multiplier_r = None
 
 
 # Gesture Router 
@@ -148,12 +223,27 @@ class GestureRouter:
         # Bug 2 Fix: Rolling landmark frame buffer for DTW dynamic gesture matching.
         # Stores recent landmark frames per hand so custom dynamic gestures can be
         # matched against full motion sequences (not just a single frame placeholder).
-        from collections import deque as _deque
-        self._landmark_buf: dict[str, "_deque"] = {
-            "Left":  _deque(maxlen=30),
-            "Right": _deque(maxlen=30),
+        self._landmark_buf: dict[str, _LandmarkRing] = {
+            "Left":  _LandmarkRing(maxlen=30),
+            "Right": _LandmarkRing(maxlen=30),
         }
 
+        # Memo for static DTW matching: (quantised landmark bytes, match) per
+        # hand. A stationary hand produces near-identical landmarks frame after
+        # frame; when the quantised pose hasn't changed we reuse the previous
+        # match instead of re-scanning every custom-gesture sample.
+        self._static_dtw_cache: dict[str, tuple[bytes, Optional[str]]] = {}
+
+        # Per-frame binding/action metadata caches. get_binding() and the
+        # action accessors each walk nested dicts under the config lock; the
+        # same handful of gesture/action ids recur every frame, so we memoise
+        # the answers and drop them whenever the config version changes
+        # (covers both file reloads and WS-driven set_binding() writes).
+        self._binding_cache:    dict[str, Optional[str]] = {}
+        self._repeatable_cache: dict[str, bool] = {}
+        self._modifier_cache:   dict[str, bool] = {}
+        self._cache_version = -1
+
         config.on_reload(lambda _: self._refresh())
 
     def _refresh(self):
@@ -164,8 +254,19 @@ class GestureRouter:
         )
         self._max_product   = mc.get("max_product", 25)
         self._multiplier_on = mc.get("enabled", True)
+        self._invalidate_caches()
         logger.info("GestureRouter refreshed.")
 
+    def _invalidate_caches(self):
+        self._binding_cache.clear()
+        self._repeatable_cache.clear()
+        self._modifier_cache.clear()
+        # A held pose keeps hitting this memo for as long as the quantised
+        # landmarks don't move, so a deleted/edited custom gesture would
+        # otherwise keep firing its stale match
+        self._static_dtw_cache.clear()
+        self._cache_version = self.cfg.version
+
     # Main Entry 
 
     def route(self, frame_result: FrameResult) -> list[ActionEvent]:
@@ -174,14 +275,18 @@ class GestureRouter:
         """
         events: list[ActionEvent] = []
 
+        if self.cfg.version != self._cache_version:
+            self._invalidate_caches()
+
         #  multiplier tracker for all detected hands
         # Push current landmarks into rolling buffer for DTW dynamic matching
         for label, hr in frame_result.hands.items():
             self._landmark_buf[label].append(hr.landmarks)
 
+        now = time.time()
         for label, hr in frame_result.hands.items():
             if self._multiplier_on:
-                self._multiplier.update(label, hr.is_stationary, hr.finger_count)
+                self._multiplier.update(label, hr.is_stationary, hr.finger_count, now=now)
 
         # Two-hand combo takes priority 
         if frame_result.combo_gesture:
@@ -203,7 +308,9 @@ class GestureRouter:
                 if secondary_action and secondary_action != event.action_id:
                     secondary_meta = {
                         "pinch_distance": hr.pinch_distance,
-                        "landmarks":      hr.landmarks.tolist(),
+                        # ndarray passthrough — serialised natively at the WS
+                        # boundary instead of tolist()ing 63 floats per frame
+                        "landmarks":      hr.landmarks,
                     }
                     events.append(ActionEvent(
                         action_id=secondary_action,
@@ -234,11 +341,34 @@ class GestureRouter:
     # ── Internal Helpers ────────────────────────────────────────────────────────
 
     def _get_task(self, gesture_id: str) -> Optional[str]:
-        """Delegate binding lookup to GestureTaskMapper (with cfg fallback)."""
+        """Delegate binding lookup to GestureTaskMapper (with cfg fallback). Memoised."""
+        try:
+            return self._binding_cache[gesture_id]
+        except KeyError:
+            pass
         if self._mapper is not None:
-            return self._mapper.get_task(gesture_id)
-        # Legacy fallback — should not normally be reached
-        return self.cfg.get_binding(gesture_id)
+            action_id = self._mapper.get_task(gesture_id)
+        else:
+            # Legacy fallback — should not normally be reached
+            action_id = self.cfg.get_binding(gesture_id)
+        self._binding_cache[gesture_id] = action_id
+        return action_id
+
+    def _is_repeatable(self, action_id: str) -> bool:
+        try:
+            return self._repeatable_cache[action_id]
+        except KeyError:
+            val = self.cfg.is_repeatable(action_id)
+            self._repeatable_cache[action_id] = val
+            return val
+
+    def _has_modifier(self, action_id: str) -> bool:
+        try:
+            return self._modifier_cache[action_id]
+        except KeyError:
+            val = self.cfg.action_has_modifier(action_id)
+            self._modifier_cache[action_id] = val
+            return val
 
     #  Combo Resolution 
 
@@ -251,7 +381,7 @@ class GestureRouter:
 
         # One-shot: only fire on gesture onset
         if self._last_gesture["Both"] == gid:
-            repeatable = self.cfg.is_repeatable(action_id)
+            repeatable = self._is_repeatable(action_id)
             if not repeatable:
                 return None
 
@@ -263,7 +393,7 @@ class GestureRouter:
             gesture_id=gid,
             hand="Both",
             magnitude=1,
-            repeatable=self.cfg.is_repeatable(action_id),
+            repeatable=self._is_repeatable(action_id),
         )
 
     #  Single-Hand Resolution 
@@ -279,14 +409,25 @@ class GestureRouter:
         # Try built-in binding via GestureTaskMapper (not cfg directly)
         action_id = self._get_task(gesture_id)
 
-        # Always run DTW custom gesture matching every frame.
+        # Run DTW custom gesture matching.
         # Custom gestures may look identical to built-in gestures from the
         # detector's perspective, so we check if the live landmarks/sequence
         # better match a custom gesture and give custom gestures priority.
+        # Static matching only makes sense on a still hand, so it is gated on
+        # is_stationary — moving frames skip the full custom-gesture scan.
         if hr.dynamic_gesture:
             custom_match = self.dtw.match_dynamic(self._get_dynamic_sequence(hr))
+        elif hr.is_stationary:
+            # ~1e-3 quantisation absorbs sensor jitter so a held pose hits the memo
+            key = np.round(hr.landmarks, 3).tobytes()
+            cached = self._static_dtw_cache.get(hr.label)
+            if cached is not None and cached[0] == key:
+                custom_match = cached[1]
+            else:
+                custom_match = self.dtw.match_static(hr.landmarks)
+                self._static_dtw_cache[hr.label] = (key, custom_match)
         else:
-            custom_match = self.dtw.match_static(hr.landmarks)
+            custom_match = None
 
         if custom_match:
             # Custom gesture takes priority over built-in binding
@@ -296,7 +437,7 @@ class GestureRouter:
         if not action_id:
             return None
 
-        repeatable = self.cfg.is_repeatable(action_id)
+        repeatable = self._is_repeatable(action_id)
 
         # One-shot guard: skip if gesture hasn't changed and action isn't repeatable
         if self._last_gesture[hr.label] == gesture_id and not repeatable:
@@ -307,7 +448,7 @@ class GestureRouter:
 
         #  Compute magnitude for tab-switching gestures 
         magnitude = 1
-        if gesture_id in self.TAB_SWIPE_GESTURES and self.cfg.action_has_modifier(action_id):
+        if gesture_id in self.TAB_SWIPE_GESTURES and self._has_modifier(action_id):
             swipe_fingers      = max(1, hr.finger_count)
             multiplier_fingers = self._multiplier.get_multiplier_for_other_hand(hr.label)
             magnitude = min(swipe_fingers * multiplier_fingers, self._max_product)
@@ -321,7 +462,7 @@ class GestureRouter:
         # drive continuous secondary actions (e.g. PEACE drives cursor_move)
         if action_id.startswith("cursor") or gesture_id in self.CONTINUOUS_SECONDARY:
             meta["pinch_distance"] = hr.pinch_distance
-            meta["landmarks"]      = hr.landmarks.tolist()
+            meta["landmarks"]      = hr.landmarks   # ndarray passthrough
 
         return ActionEvent(
             action_id=action_id,
@@ -334,13 +475,14 @@ class GestureRouter:
 
     # Helpers 
 
-    def _get_dynamic_sequence(self, hr: HandResult) -> list:
+    def _get_dynamic_sequence(self, hr: HandResult):
         """
-        Return the recent landmark sequence for dynamic custom gesture DTW matching.
-        Uses the router's rolling landmark buffer (populated every frame in route()).
-        Falls back to a single frame if the buffer is nearly empty.
+        Return the recent landmark sequence for dynamic custom gesture DTW matching
+        as a (count, 21, 3) array in chronological order.
+        Uses the router's rolling landmark ring (populated every frame in route()).
+        Falls back to a single frame if the ring is nearly empty.
         """
-        buf = self._landmark_buf.get(hr.label, [])
-        if len(buf) >= 3:
-            return list(buf)
+        buf = self._landmark_buf.get(hr.label)
+        if buf is not None and len(buf) >= 3:
+            return buf.sequence()
         return [hr.landmarks]
@@ -23,9 +23,10 @@ Key improvements over the original standalone script
 import math
 import time
 import logging
-from collections import deque, Counter
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional
+from pathlib import Path
+from typing import Callable, Optional
 
 import cv2
 import mediapipe as mp
@@ -33,13 +34,81 @@ import numpy as np
 
 from pipeline.config_manager import ConfigManager
 
+try:
+    import numba                # JIT for the per-frame geometry kernels
+except ImportError:
+    numba = None
+
 logger = logging.getLogger(__name__)
 
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _hinge_angles_nb(lm: np.ndarray, tri: np.ndarray) -> np.ndarray:
+        """All hinge angles (degrees) for the (n, 3) triplet index table."""
+        n = tri.shape[0]
+        out = np.empty(n, dtype=np.float32)
+        for k in range(n):
+            a, b, c = tri[k, 0], tri[k, 1], tri[k, 2]
+            v1x = lm[a, 0] - lm[b, 0]
+            v1y = lm[a, 1] - lm[b, 1]
+            v1z = lm[a, 2] - lm[b, 2]
+            v2x = lm[c, 0] - lm[b, 0]
+            v2y = lm[c, 1] - lm[b, 1]
+            v2z = lm[c, 2] - lm[b, 2]
+            dot = v1x * v2x + v1y * v2y + v1z * v2z
+            n1 = math.sqrt(v1x * v1x + v1y * v1y + v1z * v1z)
+            n2 = math.sqrt(v2x * v2x + v2y * v2y + v2z * v2z)
+            cos_a = dot / (n1 * n2 + 1e-6)
+            if cos_a > 1.0:
+                cos_a = 1.0
+            elif cos_a < -1.0:
+                cos_a = -1.0
+            out[k] = math.degrees(math.acos(cos_a))
+        return out
+
+    @numba.njit(cache=True, fastmath=True)
+    def _traj_stats_nb(pts: np.ndarray) -> tuple:
+        """
+        One pass over an (n, 2) trajectory: net displacement, path length,
+        horizontal-extrema count and x-variance for the swipe/wave tests.
+        """
+        n = pts.shape[0]
+        dx = pts[n - 1, 0] - pts[0, 0]
+        dy = pts[n - 1, 1] - pts[0, 1]
+        path = 0.0
+        for i in range(1, n):
+            ex = pts[i, 0] - pts[i - 1, 0]
+            ey = pts[i, 1] - pts[i - 1, 1]
+            path += math.sqrt(ex * ex + ey * ey)
+        extrema = 0
+        sx = 0.0
+        sxx = 0.0
+        for i in range(n):
+            x = pts[i, 0]
+            sx += x
+            sxx += x * x
+            if 0 < i < n - 1:
+                if (x > pts[i - 1, 0] and x > pts[i + 1, 0]) or \
+                   (x < pts[i - 1, 0] and x < pts[i + 1, 0]):
+                    extrema += 1
+        mean = sx / n
+        var_x = sxx / n - mean * mean
+        return float(dx), float(dy), path, extrema, var_x
+
+    # Warm the JITs at import so the first frame doesn't pay compile latency
+    _hinge_angles_nb(np.zeros((21, 3), dtype=np.float32),
+                     np.zeros((1, 3), dtype=np.intp))
+    _traj_stats_nb(np.zeros((2, 2), dtype=np.float32))
+else:
+    _hinge_angles_nb = None
+    _traj_stats_nb = None
+
 @dataclass
 class HandResult:
     """Processed result for a single hand in one frame."""
     label: str                          # "Left" or "Right"
-    landmarks: np.ndarray               # shape (21, 3) normalised 0–1
+    landmarks: np.ndarray               # (21, 3) float32, normalised 0–1
     static_gesture: Optional[str]       # e.g. "FIST", "PALM", "PEACE" or None
     dynamic_gesture: Optional[str]      # e.g. "SWIPE_LEFT", "WAVE" or None
     palm_facing: bool                   # True = palm faces camera
@@ -64,6 +133,90 @@ STATIONARY_VELOCITY_THRESHOLD = 0.008   # normalised units/frame
 PINCH_THRESHOLD_DEFAULT = 0.05          # normalised distance
 
 
+# ── Majority-Vote Buffer ───────────────────────────────────────────────────────
+
+class _MajorityBuffer:
+    """
+    Fixed-size gesture buffer with an incrementally maintained tally.
+
+    Replaces the per-frame ``Counter(buf).most_common(1)`` recount: the tally
+    is updated in O(1) on append/evict, so the majority lookup only scans the
+    handful of distinct gesture names currently in the window.
+    """
+
+    __slots__ = ("_buf", "_tally")
+
+    def __init__(self, maxlen: int):
+        self._buf: deque = deque(maxlen=maxlen)
+        self._tally: dict[str, int] = {}
+
+    def append(self, item: str):
+        buf = self._buf
+        if len(buf) == buf.maxlen:
+            evicted = buf[0]
+            count = self._tally[evicted] - 1
+            if count:
+                self._tally[evicted] = count
+            else:
+                del self._tally[evicted]
+        buf.append(item)
+        self._tally[item] = self._tally.get(item, 0) + 1
+
+    def majority(self) -> str:
+        """Most common item in the buffer (ties favour earliest-seen)."""
+        return max(self._tally, key=self._tally.__getitem__)
+
+    def clear(self):
+        self._buf.clear()
+        self._tally.clear()
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+
+
+# ── Trajectory Ring Buffer ─────────────────────────────────────────────────────
+
+class _PointRing:
+    """
+    Preallocated (maxlen, 2) float32 ring of trajectory points.
+
+    Replaces the deque-of-tuples position history: append() writes one row in
+    place and view() hands _detect_dynamic a chronological ndarray, so the
+    per-frame np.asarray walk over up to 25 Python tuples disappears.
+    """
+
+    __slots__ = ("_buf", "_idx", "_count")
+
+    def __init__(self, maxlen: int):
+        self._buf = np.empty((maxlen, 2), dtype=np.float32)
+        self._idx = 0
+        self._count = 0
+
+    def append(self, x: float, y: float):
+        buf = self._buf
+        buf[self._idx, 0] = x
+        buf[self._idx, 1] = y
+        self._idx = (self._idx + 1) % len(buf)
+        if self._count < len(buf):
+            self._count += 1
+
+    def view(self) -> np.ndarray:
+        """Chronological (n, 2) array of the buffered points."""
+        if self._count < len(self._buf):
+            return self._buf[:self._count]
+        if self._idx == 0:
+            return self._buf
+        return np.concatenate((self._buf[self._idx:], self._buf[:self._idx]))
+
+    def clear(self):
+        self._idx = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+
 # ── Gesture Detector ───────────────────────────────────────────────────────────
 
 class GestureDetector:
@@ -87,8 +240,29 @@ class GestureDetector:
     RING_MCP, RING_PIP, RING_DIP, RING_TIP = 13, 14, 15, 16
     PINKY_MCP, PINKY_PIP, PINKY_DIP, PINKY_TIP = 17, 18, 19, 20
 
-    def __init__(self, config: ConfigManager):
+    # Direction lookup tables indexed by quantised angle sector (see
+    # _detect_static / _detect_dynamic)
+    _POINT_DIRS = ("RIGHT", "UP", "UP", "LEFT", "LEFT", "DOWN", "DOWN", "UNKNOWN")
+    _SWIPE_DIRS = ("SWIPE_LEFT", "SWIPE_UP", "SWIPE_RIGHT", "SWIPE_DOWN")
+
+    # Every hinge triplet tested by _extended_mask: thumb MCP→IP→TIP, then
+    # MCP→PIP→DIP and PIP→DIP→TIP for each remaining finger. One fancy-index
+    # gather over this table replaces nine scalar _angle() calls per hand.
+    _ANGLE_TRIPLETS = np.array([
+        (THUMB_MCP,  THUMB_IP,   THUMB_TIP),
+        (INDEX_MCP,  INDEX_PIP,  INDEX_DIP),  (INDEX_PIP,  INDEX_DIP,  INDEX_TIP),
+        (MIDDLE_MCP, MIDDLE_PIP, MIDDLE_DIP), (MIDDLE_PIP, MIDDLE_DIP, MIDDLE_TIP),
+        (RING_MCP,   RING_PIP,   RING_DIP),   (RING_PIP,   RING_DIP,   RING_TIP),
+        (PINKY_MCP,  PINKY_PIP,  PINKY_DIP),  (PINKY_PIP,  PINKY_DIP,  PINKY_TIP),
+    ], dtype=np.intp)
+
+    def __init__(self, config: ConfigManager,
+                 preview_needed: Optional[Callable[[], bool]] = None):
         self.cfg = config
+        # Optional "is anyone watching?" probe. The overlay (skeletons,
+        # panels) never affects gesture decisions, so when this returns False
+        # all drawing is skipped. None means always draw (standalone demo).
+        self.preview_needed = preview_needed
         self._init_mediapipe()
 
         s = config.settings
@@ -97,17 +271,17 @@ class GestureDetector:
         hist = s.get("position_history_size", 25)
 
         # Per-hand buffers (named consistently for external access in main.py)
-        self._static_buf: dict[str, deque] = {
-            "Left":  deque(maxlen=buf),
-            "Right": deque(maxlen=buf),
+        self._static_buf: dict[str, _MajorityBuffer] = {
+            "Left":  _MajorityBuffer(maxlen=buf),
+            "Right": _MajorityBuffer(maxlen=buf),
         }
-        self._dynamic_buf: dict[str, deque] = {
-            "Left":  deque(maxlen=dbuf),
-            "Right": deque(maxlen=dbuf),
+        self._dynamic_buf: dict[str, _MajorityBuffer] = {
+            "Left":  _MajorityBuffer(maxlen=dbuf),
+            "Right": _MajorityBuffer(maxlen=dbuf),
         }
-        self._pos_history: dict[str, deque] = {
-            "Left":  deque(maxlen=hist),
-            "Right": deque(maxlen=hist),
+        self._pos_history: dict[str, _PointRing] = {
+            "Left":  _PointRing(maxlen=hist),
+            "Right": _PointRing(maxlen=hist),
         }
         self._wrist_history: dict[str, deque] = {
             "Left":  deque(maxlen=6),
@@ -116,6 +290,12 @@ class GestureDetector:
 
         # Two-hand combo patterns (from config)
         self._combo_patterns = self._build_combo_patterns()
+        # Inverted index for _detect_combo: one dict get per frame instead of
+        # scanning every pattern. setdefault keeps first-wins semantics if
+        # two combos ever claim the same (left, right) pair.
+        self._combo_lookup: dict = {}
+        for combo_id, pair in self._combo_patterns.items():
+            self._combo_lookup.setdefault(pair, combo_id)
 
         # Register live-reload callback
         config.on_reload(lambda _: self._refresh_on_reload())
@@ -125,19 +305,90 @@ class GestureDetector:
     def _init_mediapipe(self):
         s = self.cfg.settings
         self._mp_hands = mp.solutions.hands
-        self._hands = self._mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=s.get("max_num_hands", 2),
-            min_detection_confidence=s.get("detection_confidence", 0.80),
-            min_tracking_confidence=s.get("tracking_confidence", 0.70),
-            model_complexity=s.get("model_complexity", 1),
-        )
+        self._hands = None
+
+        # Prefer the Tasks HandLandmarker in LIVE_STREAM mode: detect_async
+        # returns immediately and the result callback stores the newest
+        # inference, so the model runs overlapped with the rest of the frame
+        # work instead of blocking the pipeline loop.
+        self._landmarker = None
+        self._latest_result = None          # written by _on_landmarker_result
+        self._last_ts_ms = 0
+        self._ts_origin = time.monotonic()
+        task_path = Path(__file__).with_name("hand_landmarker.task")
+        if task_path.exists():
+            try:
+                from mediapipe.tasks import python as mp_tasks
+                from mediapipe.tasks.python import vision as mp_vision
+                options = mp_vision.HandLandmarkerOptions(
+                    base_options=mp_tasks.BaseOptions(model_asset_path=str(task_path)),
+                    running_mode=mp_vision.RunningMode.LIVE_STREAM,
+                    num_hands=s.get("max_num_hands", 2),
+                    min_hand_detection_confidence=s.get("detection_confidence", 0.80),
+                    min_tracking_confidence=s.get("tracking_confidence", 0.70),
+                    result_callback=self._on_landmarker_result,
+                )
+                self._landmarker = mp_vision.HandLandmarker.create_from_options(options)
+                logger.info("MediaPipe Tasks HandLandmarker initialised (LIVE_STREAM).")
+            except Exception as e:
+                logger.warning(f"Tasks HandLandmarker unavailable ({e}) — "
+                               "falling back to mp.solutions.hands.")
+                self._landmarker = None
+
+        if self._landmarker is None:
+            self._hands = self._mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=s.get("max_num_hands", 2),
+                min_detection_confidence=s.get("detection_confidence", 0.80),
+                min_tracking_confidence=s.get("tracking_confidence", 0.70),
+                model_complexity=s.get("model_complexity", 1),
+            )
         self._mp_draw = mp.solutions.drawing_utils
+        # HAND_CONNECTIONS as a (N, 2) index array, built once — _draw_skeleton
+        # gathers both endpoints of every bone with a single fancy-index and
+        # draws them in one cv2.polylines call instead of N cv2.line calls.
+        self._connections = np.array(
+            sorted(self._mp_hands.HAND_CONNECTIONS), dtype=np.intp
+        )
+        # Persistent RGB buffer (allocated lazily on first frame) so cvtColor
+        # writes in place instead of allocating HxWx3 every frame; the
+        # horizontal flip itself mirrors the capture buffer in place.
+        self._rgb_buf: Optional[np.ndarray] = None
+        # Inference downscale: the palm detector resizes its input to 192×192
+        # internally, so feeding more than ~VGA costs cvtColor/resize bandwidth
+        # without improving landmarks. Frames wider than inference_width are
+        # shrunk (into a persistent buffer) before MediaPipe; landmarks are
+        # normalised so nothing downstream needs rescaling.
+        self._infer_width = int(s.get("inference_width", 640))
+        self._infer_buf: Optional[np.ndarray] = None
+        self._infer_bgr_buf: Optional[np.ndarray] = None
+        # Held gestures leave long runs of nearly identical frames; when the
+        # mean absdiff of a 64×36 thumbnail against the last-inferred frame
+        # stays under this threshold, inference is skipped and the previous
+        # detection reused (0 disables the gate).
+        self._skip_diff_threshold = float(s.get("frame_skip_diff_threshold", 2.0))
+        self._prev_small: Optional[np.ndarray] = None
+        self._prev_detected: Optional[list] = None
+        # Static debug-UI panels (frames + titles) pre-rasterised once per
+        # frame size — see _ui_panels(). Keyed on width so a resolution
+        # change re-renders them.
+        self._panel_cache: Optional[tuple[int, list]] = None
+        # flip + BGR2RGB are memory-bound (~2.6 MB each at 720p); run them on
+        # the OpenCL T-API when a device is available, CPU buffers otherwise.
+        self._use_opencl = bool(cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL())
+        if self._use_opencl:
+            logger.info("OpenCL available — flip/cvtColor will use the T-API.")
         logger.info("MediaPipe Hands initialised.")
 
     def _refresh_on_reload(self):
         """Called when config file changes while pipeline is running."""
         self._combo_patterns = self._build_combo_patterns()
+        # Inverted index for _detect_combo: one dict get per frame instead of
+        # scanning every pattern. setdefault keeps first-wins semantics if
+        # two combos ever claim the same (left, right) pair.
+        self._combo_lookup: dict = {}
+        for combo_id, pair in self._combo_patterns.items():
+            self._combo_lookup.setdefault(pair, combo_id)
         logger.info("GestureDetector refreshed from config.")
 
     def _build_combo_patterns(self) -> dict:
@@ -165,28 +416,80 @@ class GestureDetector:
         """
         Main entry point.  Takes a raw BGR frame, returns (annotated_frame, FrameResult).
         """
-        frame = cv2.flip(frame, 1)
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self._hands.process(rgb)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        if self._use_opencl:
+            # One upload, flip + colour-convert on the device, then download
+            # (MediaPipe needs a contiguous host ndarray)
+            u = cv2.flip(cv2.UMat(frame), 1)
+            frame = u.get()
+            self._rgb_buf = cv2.cvtColor(u, cv2.COLOR_BGR2RGB).get()
+            rgb = self._rgb_buf
+            h, w = rgb.shape[:2]
+            if 0 < self._infer_width < w:
+                iw = self._infer_width
+                ih = round(h * iw / w)
+                if self._infer_buf is None or self._infer_buf.shape[:2] != (ih, iw):
+                    self._infer_buf = np.empty((ih, iw, 3), dtype=np.uint8)
+                cv2.resize(rgb, (iw, ih), dst=self._infer_buf,
+                           interpolation=cv2.INTER_AREA)
+                rgb = self._infer_buf
+        else:
+            # Horizontal flip is safe in place (OpenCV mirrors row-wise), so
+            # the capture buffer is mirrored directly — no staging copy
+            cv2.flip(frame, 1, dst=frame)
+            h, w = frame.shape[:2]
+            if 0 < self._infer_width < w:
+                # Downscale first, convert after: BGR→RGB is a pure per-pixel
+                # channel swap, so it commutes with the per-channel INTER_AREA
+                # resize and only needs to touch the small inference buffer
+                # instead of the full frame. The full-res RGB copy is never
+                # materialised on this path.
+                iw = self._infer_width
+                ih = round(h * iw / w)
+                if self._infer_buf is None or self._infer_buf.shape[:2] != (ih, iw):
+                    self._infer_bgr_buf = np.empty((ih, iw, 3), dtype=np.uint8)
+                    self._infer_buf     = np.empty((ih, iw, 3), dtype=np.uint8)
+                cv2.resize(frame, (iw, ih), dst=self._infer_bgr_buf,
+                           interpolation=cv2.INTER_AREA)
+                cv2.cvtColor(self._infer_bgr_buf, cv2.COLOR_BGR2RGB,
+                             dst=self._infer_buf)
+                rgb = self._infer_buf
+            else:
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+                rgb = self._rgb_buf
+
+        # Change gate: a ~7 KB thumbnail diff against the frame we last ran
+        # inference on, vs ~5-6 ms of ML per frame. On a skip the previous
+        # detection is reused but _process_hand still runs, so position
+        # history keeps advancing and a held pose decays to stationary
+        # exactly as before. The thumbnail is only refreshed when inference
+        # runs, so slow drift accumulates and eventually re-triggers it.
+        small = cv2.resize(rgb, (64, 36), interpolation=cv2.INTER_AREA)
+        if (
+            self._prev_small is not None
+            and self._prev_detected is not None
+            and cv2.norm(small, self._prev_small, cv2.NORM_L1) / small.size
+                < self._skip_diff_threshold
+        ):
+            detected = self._prev_detected
+        else:
+            detected = self._detect_hands(rgb)
+            self._prev_detected = detected
+            self._prev_small = small
 
         frame_result = FrameResult()
+        draw = self.preview_needed is None or self.preview_needed()
 
-        if results.multi_hand_landmarks and results.multi_handedness:
-            for hand_lms, handedness in zip(
-                results.multi_hand_landmarks, results.multi_handedness
-            ):
-                label      = handedness.classification[0].label   # "Left" / "Right"
-                confidence = handedness.classification[0].score
-
-                # Draw skeleton
-                color = (0, 255, 0) if label == "Left" else (255, 0, 0)
-                self._mp_draw.draw_landmarks(
-                    frame, hand_lms, self._mp_hands.HAND_CONNECTIONS,
-                    self._mp_draw.DrawingSpec(color=color, thickness=2, circle_radius=2),
-                    self._mp_draw.DrawingSpec(color=color, thickness=2),
-                )
+        if detected:
+            for label, confidence, landmarks in detected:
+                if draw:
+                    # Both paths draw from the landmark array: one batched
+                    # polylines call beats draw_landmarks' per-bone Python
+                    # loop and per-hand DrawingSpec construction
+                    color = (0, 255, 0) if label == "Left" else (255, 0, 0)
+                    self._draw_skeleton(frame, landmarks, color)
 
-                landmarks = np.array([[lm.x, lm.y, lm.z] for lm in hand_lms.landmark])
                 hand_result = self._process_hand(landmarks, label, confidence)
                 frame_result.hands[label] = hand_result
 
@@ -201,12 +504,84 @@ class GestureDetector:
                 self._pos_history[side].clear()
                 self._wrist_history[side].clear()
 
-        self._draw_ui(frame, frame_result)
+        if draw:
+            self._draw_ui(frame, frame_result)
         return frame, frame_result
 
     def close(self):
         """Release MediaPipe resources."""
-        self._hands.close()
+        if self._landmarker is not None:
+            self._landmarker.close()
+        if self._hands is not None:
+            self._hands.close()
+
+    # ── Hand Detection ─────────────────────────────────────────────────────────
+
+    def _on_landmarker_result(self, result, output_image, timestamp_ms: int):
+        """LIVE_STREAM callback — store the newest completed inference."""
+        self._latest_result = result
+
+    def _detect_hands(self, rgb: np.ndarray) -> list[tuple]:
+        """
+        Run hand inference on the prepared (possibly downscaled) RGB buffer.
+
+        Returns a list of (label, confidence, landmarks(21,3)) per detected
+        hand; both API paths draw from the array via _draw_skeleton.
+        """
+        hands: list[tuple] = []
+
+        if self._landmarker is not None:
+            # Async submit; consume the newest completed result (typically the
+            # previous frame's — one frame of landmark latency in exchange for
+            # inference overlapping the rest of the loop).
+            ts = int((time.monotonic() - self._ts_origin) * 1000)
+            if ts <= self._last_ts_ms:
+                ts = self._last_ts_ms + 1
+            self._last_ts_ms = ts
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+            self._landmarker.detect_async(mp_image, ts)
+
+            result = self._latest_result
+            if result is not None and result.hand_landmarks:
+                for lms, handedness in zip(result.hand_landmarks, result.handedness):
+                    landmarks = np.fromiter(
+                        (c for lm in lms for c in (lm.x, lm.y, lm.z)),
+                        dtype=np.float32, count=63,
+                    ).reshape(21, 3)
+                    hands.append(
+                        (handedness[0].category_name, handedness[0].score,
+                         landmarks)
+                    )
+            return hands
+
+        results = self._hands.process(rgb)
+        if results.multi_hand_landmarks and results.multi_handedness:
+            for hand_lms, handedness in zip(
+                results.multi_hand_landmarks, results.multi_handedness
+            ):
+                # Single fromiter pass over the protobuf instead of building a
+                # 21-element list-of-lists per hand per frame
+                landmarks = np.fromiter(
+                    (c for lm in hand_lms.landmark for c in (lm.x, lm.y, lm.z)),
+                    dtype=np.float32, count=63,
+                ).reshape(21, 3)
+                hands.append(
+                    (handedness.classification[0].label,
+                     handedness.classification[0].score,
+                     landmarks)
+                )
+        return hands
+
+    def _draw_skeleton(self, frame: np.ndarray, landmarks: np.ndarray, color: tuple):
+        """Draw the hand skeleton from a (21,3) landmark array."""
+        h, w = frame.shape[:2]
+        pts = (landmarks[:, :2] * (w, h)).astype(np.int32)
+        # All 21 bones in one polylines call: pts[self._connections] gathers a
+        # (N, 2, 2) array of segment endpoints, so OpenCV iterates the bones in
+        # C instead of Python making N line calls with tuple conversions
+        cv2.polylines(frame, pts[self._connections], False, color, 2)
+        for x, y in pts:
+            cv2.circle(frame, (int(x), int(y)), 2, color, 2)
 
     # ── Per-Hand Processing ────────────────────────────────────────────────────
 
@@ -218,8 +593,9 @@ class GestureDetector:
     ) -> HandResult:
 
         palm_facing  = self._is_palm_facing(landmarks, label)
-        static_raw   = self._detect_static(landmarks, palm_facing, label)
-        finger_count = self._count_extended_fingers(landmarks)
+        extended     = self._extended_mask(landmarks)
+        static_raw   = self._detect_static(landmarks, extended, palm_facing, label)
+        finger_count = sum(extended)
         pinch_dist   = self._pinch_distance(landmarks)
         velocity, is_stationary = self._compute_velocity(landmarks, label)
 
@@ -229,15 +605,15 @@ class GestureDetector:
         # Dynamic detection — always run regardless of static gesture so swipes
         # are detected even when holding a fist, palm, etc.
         dynamic_gesture = None
-        tip = (landmarks[self.MIDDLE_TIP][0], landmarks[self.MIDDLE_TIP][1])
-        self._pos_history[label].append(tip)
+        tip = landmarks[self.MIDDLE_TIP]
+        self._pos_history[label].append(tip[0], tip[1])
         raw_dyn = self._detect_dynamic(self._pos_history[label])
 
         if raw_dyn:
             self._dynamic_buf[label].append(raw_dyn)
             # Require 2 consistent frames to fire dynamic gesture
             if len(self._dynamic_buf[label]) >= 2:
-                dynamic_gesture = Counter(self._dynamic_buf[label]).most_common(1)[0][0]
+                dynamic_gesture = self._dynamic_buf[label].majority()
         else:
             # Clear dynamic buffer only after enough position history has built up
             if len(self._pos_history[label]) >= 20:
@@ -258,54 +634,60 @@ class GestureDetector:
 
     # ── Finger Extension (angle-based) ─────────────────────────────────────────
 
-    def _is_finger_extended(self, landmarks: np.ndarray, finger: str) -> bool:
-        if finger == "thumb":
-            angle = self._angle(
-                landmarks[self.THUMB_MCP],
-                landmarks[self.THUMB_IP],
-                landmarks[self.THUMB_TIP],
+    def _extended_mask(self, landmarks: np.ndarray) -> tuple:
+        """
+        (thumb, index, middle, ring, pinky) extension flags.
+
+        All nine hinge angles come from one batched computation over
+        _ANGLE_TRIPLETS — a gather, two vectorised norms and one arccos —
+        instead of nine scalar _angle() calls per hand per frame.
+        """
+        tri = self._ANGLE_TRIPLETS
+        if _hinge_angles_nb is not None:
+            # Compiled scalar loop — beats the NumPy batch at this size (9
+            # rows) where per-ufunc dispatch dominates the actual FLOPs
+            ang = _hinge_angles_nb(landmarks, tri)
+        else:
+            p2 = landmarks[tri[:, 1]]
+            v1 = landmarks[tri[:, 0]] - p2
+            v2 = landmarks[tri[:, 2]] - p2
+            cos_a = np.clip(
+                (v1 * v2).sum(axis=1)
+                / (np.linalg.norm(v1, axis=1) * np.linalg.norm(v2, axis=1) + 1e-6),
+                -1.0, 1.0,
             )
-            return angle > 160
-        mapping = {
-            "index":  (self.INDEX_TIP,  self.INDEX_DIP,  self.INDEX_PIP,  self.INDEX_MCP),
-            "middle": (self.MIDDLE_TIP, self.MIDDLE_DIP, self.MIDDLE_PIP, self.MIDDLE_MCP),
-            "ring":   (self.RING_TIP,   self.RING_DIP,   self.RING_PIP,   self.RING_MCP),
-            "pinky":  (self.PINKY_TIP,  self.PINKY_DIP,  self.PINKY_PIP,  self.PINKY_MCP),
-        }
-        tip, dip, pip_, mcp = mapping[finger]
+            ang = np.degrees(np.arccos(cos_a))
         return (
-            self._angle(landmarks[mcp], landmarks[pip_], landmarks[dip]) > 140 and
-            self._angle(landmarks[pip_], landmarks[dip], landmarks[tip]) > 140
-        )
-
-    def _count_extended_fingers(self, landmarks: np.ndarray) -> int:
-        """Return 0–5 count of extended fingers, thumb included."""
-        return sum(
-            self._is_finger_extended(landmarks, f)
-            for f in ("thumb", "index", "middle", "ring", "pinky")
+            bool(ang[0] > 160),                  # thumb: single MCP-IP-TIP test
+            bool((ang[1] > 140) & (ang[2] > 140)),
+            bool((ang[3] > 140) & (ang[4] > 140)),
+            bool((ang[5] > 140) & (ang[6] > 140)),
+            bool((ang[7] > 140) & (ang[8] > 140)),
         )
 
     # ── Palm Facing ────────────────────────────────────────────────────────────
 
     def _is_palm_facing(self, landmarks: np.ndarray, handedness: str) -> bool:
-        wrist     = np.array(landmarks[self.WRIST])
-        index_mcp = np.array(landmarks[self.INDEX_MCP])
-        pinky_mcp = np.array(landmarks[self.PINKY_MCP])
-        normal    = np.cross(index_mcp - wrist, pinky_mcp - wrist)
-        facing    = normal[2] > 0
+        # Only the z-component of the palm normal is tested, so compute it
+        # directly with four scalar multiplies — no np.array re-wrapping and
+        # no full np.cross on boxed 3-vectors
+        w = landmarks[self.WRIST]
+        i = landmarks[self.INDEX_MCP]
+        p = landmarks[self.PINKY_MCP]
+        normal_z = (i[0] - w[0]) * (p[1] - w[1]) - (i[1] - w[1]) * (p[0] - w[0])
+        facing = bool(normal_z > 0)
         if handedness == "Left":
             facing = not facing
         return facing
 
     # ── Static Gesture Detection ───────────────────────────────────────────────
 
-    def _detect_static(self, lm: np.ndarray, palm_facing: bool, handedness: str) -> str:
-        t = self._is_finger_extended(lm, "thumb")
-        i = self._is_finger_extended(lm, "index")
-        m = self._is_finger_extended(lm, "middle")
-        r = self._is_finger_extended(lm, "ring")
-        p = self._is_finger_extended(lm, "pinky")
-        n = sum([t, i, m, r, p])
+    def _detect_static(self, lm: np.ndarray, extended: tuple,
+                       palm_facing: bool, handedness: str) -> str:
+        # `extended` is the mask _process_hand already computed — the angle
+        # batch runs once per hand and both consumers share it
+        t, i, m, r, p = extended
+        n = sum(extended)
 
         if n == 0:
             return "FIST"
@@ -318,13 +700,14 @@ class GestureDetector:
             return "INDEX_ONLY"
 
         # PEACE: index + middle extended, fingers separated
+        # (squared distances vs squared thresholds — avoids sqrt per frame)
         if i and m and not r and not p:
-            sep = self._dist(lm[self.INDEX_TIP], lm[self.MIDDLE_TIP])
-            if 0.05 < sep < 0.15:
+            sep_sq = self._dist_sq(lm[self.INDEX_TIP], lm[self.MIDDLE_TIP])
+            if 0.0025 < sep_sq < 0.0225:   # 0.05² < sep < 0.15²
                 return "PEACE"
 
         # OK: thumb touching index tip, other three fingers extended
-        if self._dist(lm[self.THUMB_TIP], lm[self.INDEX_TIP]) < 0.04:
+        if self._dist_sq(lm[self.THUMB_TIP], lm[self.INDEX_TIP]) < 0.0016:  # 0.04²
             if m and r and p:
                 return "OK"
 
@@ -332,60 +715,55 @@ class GestureDetector:
             return "PALM"
 
         # Pointing direction (index finger) → RIGHT / UP / LEFT / DOWN
+        # Branchless LUT over 45° sectors (offset by half a sector so RIGHT
+        # straddles 0°) instead of a chain of range comparisons. Sector 7
+        # keeps the original chain's uncovered [292.5°, 337.5°) gap.
         if i:
-            direction = np.array(lm[self.INDEX_TIP]) - np.array(lm[self.WRIST])
-            dx, dy = direction[0], direction[1]
-            angle  = math.degrees(math.atan2(-dy, dx)) % 360
+            dx = lm[self.INDEX_TIP][0] - lm[self.WRIST][0]
+            dy = lm[self.INDEX_TIP][1] - lm[self.WRIST][1]
+            # The 180° palm flip is exactly four sectors, so it becomes
+            # integer math instead of a second float mod-360
+            sector = int((math.degrees(math.atan2(-dy, dx)) % 360 + 22.5) // 45)
             if not palm_facing:
-                angle = (angle + 180) % 360
-            half = 22.5
-            if angle >= 360 - half or angle < half:
-                return "RIGHT"
-            elif half <= angle < 90 + half:
-                return "UP"
-            elif 90 + half <= angle < 180 + half:
-                return "LEFT"
-            elif 180 + half <= angle < 270 + half:
-                return "DOWN"
+                sector += 4
+            return self._POINT_DIRS[sector % 8]
 
         return "UNKNOWN"
 
     # ── Dynamic Gesture Detection ──────────────────────────────────────────────
 
-    def _detect_dynamic(self, pos_history: deque) -> Optional[str]:
+    def _detect_dynamic(self, pos_history: _PointRing) -> Optional[str]:
         if len(pos_history) < 15:
             return None
 
-        positions = list(pos_history)
-        dx = positions[-1][0] - positions[0][0]
-        dy = positions[-1][1] - positions[0][1]
-        total = math.sqrt(dx**2 + dy**2)
-        path  = sum(
-            math.sqrt(
-                (positions[k][0] - positions[k-1][0])**2 +
-                (positions[k][1] - positions[k-1][1])**2
-            )
-            for k in range(1, len(positions))
-        )
+        # Chronological view straight out of the ring — no per-tuple walk
+        pts = pos_history.view()   # (n, 2)
+        if _traj_stats_nb is not None:
+            # Single compiled pass over the ~25-point trajectory
+            dx, dy, path, n_extrema, var_x = _traj_stats_nb(pts)
+        else:
+            dx = float(pts[-1, 0] - pts[0, 0])
+            dy = float(pts[-1, 1] - pts[0, 1])
+            deltas = np.diff(pts, axis=0)
+            path = float(np.sqrt((deltas * deltas).sum(axis=1)).sum())
+            xs = pts[:, 0]
+            mid = xs[1:-1]
+            extrema = ((mid > xs[:-2]) & (mid > xs[2:])) | \
+                      ((mid < xs[:-2]) & (mid < xs[2:]))
+            n_extrema = int(extrema.sum())
+            var_x = float(np.var(xs))
+        total = math.hypot(dx, dy)
         straightness = total / (path + 1e-6)
 
         if total > 0.12 and straightness > 0.65:
+            # 90° sector LUT (offset so SWIPE_RIGHT straddles 0°), replacing
+            # the four-way comparison chain
             angle = math.degrees(math.atan2(dy, dx))
-            if -45 <= angle < 45:    return "SWIPE_RIGHT"
-            if 45  <= angle < 135:   return "SWIPE_DOWN"
-            if abs(angle) >= 135:    return "SWIPE_LEFT"
-            if -135 <= angle < -45:  return "SWIPE_UP"
-
-        # Wave: horizontal oscillation
-        if len(positions) >= 18:
-            xs = [pos[0] for pos in positions]
-            changes = sum(
-                1 for k in range(1, len(xs) - 1)
-                if (xs[k] > xs[k-1] and xs[k] > xs[k+1]) or
-                   (xs[k] < xs[k-1] and xs[k] < xs[k+1])
-            )
-            if changes >= 4 and np.var(xs) > 0.004:
-                return "WAVE"
+            return self._SWIPE_DIRS[int((angle + 225.0) // 90) % 4]
+
+        # Wave: horizontal oscillation — enough local extrema with spread
+        if len(pts) >= 18 and n_extrema >= 4 and var_x > 0.004:
+            return "WAVE"
 
         return None
 
@@ -398,10 +776,7 @@ class GestureDetector:
         rg = hands["Right"].static_gesture
         if not lg or not rg:
             return None
-        for combo_id, (l_pat, r_pat) in self._combo_patterns.items():
-            if lg == l_pat and rg == r_pat:
-                return combo_id
-        return None
+        return self._combo_lookup.get((lg, rg))
 
     # ── Velocity / Stationarity ────────────────────────────────────────────────
 
@@ -413,10 +788,9 @@ class GestureDetector:
         hist.append(wrist_pos)
         if len(hist) < 2:
             return 0.0, True
-        velocity = math.sqrt(
-            (hist[-1][0] - hist[-2][0])**2 +
-            (hist[-1][1] - hist[-2][1])**2
-        )
+        # hypot: one C call, no PyNumber pow dispatch, better conditioning
+        velocity = math.hypot(hist[-1][0] - hist[-2][0],
+                              hist[-1][1] - hist[-2][1])
         is_stationary = velocity < STATIONARY_VELOCITY_THRESHOLD
         return velocity, is_stationary
 
@@ -428,19 +802,28 @@ class GestureDetector:
     # ── Gesture Smoothing (majority vote) ──────────────────────────────────────
 
     @staticmethod
-    def _smooth_gesture(gesture: Optional[str], buf: deque) -> Optional[str]:
+    def _smooth_gesture(gesture: Optional[str], buf: _MajorityBuffer) -> Optional[str]:
         if gesture is None or gesture == "UNKNOWN":
             return None
         buf.append(gesture)
         if len(buf) >= 3:
-            return Counter(buf).most_common(1)[0][0]
+            return buf.majority()
         return gesture
 
     # ── Math Helpers ───────────────────────────────────────────────────────────
 
     @staticmethod
     def _dist(a, b) -> float:
-        return math.sqrt(sum((x - y) ** 2 for x, y in zip(a, b)))
+        """Euclidean distance — kept for debug/logging; hot paths use _dist_sq."""
+        return math.sqrt(GestureDetector._dist_sq(a, b))
+
+    @staticmethod
+    def _dist_sq(a, b) -> float:
+        """Squared Euclidean distance between two 3-vectors (no sqrt, no zip)."""
+        dx = a[0] - b[0]
+        dy = a[1] - b[1]
+        dz = a[2] - b[2]
+        return dx * dx + dy * dy + dz * dz
 
     @staticmethod
     def _angle(p1, p2, p3) -> float:
@@ -454,18 +837,43 @@ class GestureDetector:
 
     # ── Debug UI ───────────────────────────────────────────────────────────────
 
-    def _draw_ui(self, frame: np.ndarray, result: FrameResult):
-        h, w, _ = frame.shape
+    def _ui_panels(self, w: int) -> list:
+        """
+        Pre-rasterised static portions of the per-hand debug panels.
+
+        The panel frames and "LEFT/RIGHT HAND" titles never change, yet
+        _draw_ui used to re-render them (two rectangles + per-glyph putText)
+        every frame. Render them once per frame width into cached patches so
+        the per-frame cost is a single ROI copy per panel.
+        Returns [((y0, y1, x0, x1), patch), ...].
+        """
+        if self._panel_cache is not None and self._panel_cache[0] == w:
+            return self._panel_cache[1]
 
+        canvas = np.zeros((180, w, 3), dtype=np.uint8)
+        panels = []
         for side, x_start, color in [
             ("Left",  5,       (0, 255, 0)),
             ("Right", w - 355, (255, 0, 0)),
         ]:
-            cv2.rectangle(frame, (x_start, 5), (x_start + 345, 175), (0, 0, 0), -1)
-            cv2.rectangle(frame, (x_start, 5), (x_start + 345, 175), color, 2)
-            cv2.putText(frame, f"{side.upper()} HAND", (x_start + 10, 25),
+            cv2.rectangle(canvas, (x_start, 5), (x_start + 345, 175), (0, 0, 0), -1)
+            cv2.rectangle(canvas, (x_start, 5), (x_start + 345, 175), color, 2)
+            cv2.putText(canvas, f"{side.upper()} HAND", (x_start + 10, 25),
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+            # Bounds widened by 1px so the thickness-2 border is fully covered
+            x0, x1 = max(x_start - 1, 0), min(x_start + 347, w)
+            panels.append(((4, 177, x0, x1), canvas[4:177, x0:x1].copy()))
+
+        self._panel_cache = (w, panels)
+        return panels
+
+    def _draw_ui(self, frame: np.ndarray, result: FrameResult):
+        h, w, _ = frame.shape
+
+        for (y0, y1, x0, x1), patch in self._ui_panels(w):
+            frame[y0:y1, x0:x1] = patch
 
+        for side, x_start in [("Left", 5), ("Right", w - 355)]:
             if side in result.hands:
                 hr = result.hands[side]
                 lines = [
@@ -518,7 +926,7 @@ if __name__ == "__main__":
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
 
-    print("Press 'q' to quit, 'c' to clear buffers.")
+    logger.info("Press 'q' to quit, 'c' to clear buffers.")
 
     while cap.isOpened():
         ret, frame = cap.read()
@@ -537,7 +945,7 @@ if __name__ == "__main__":
                 detector._dynamic_buf[side].clear()
                 detector._pos_history[side].clear()
                 detector._wrist_history[side].clear()
-            print("Buffers cleared.")
+            logger.info("Buffers cleared.")
 
     cap.release()
     cv2.destroyAllWindows()
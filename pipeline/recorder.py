@@ -23,6 +23,7 @@ Usage:
         ws_server.broadcast_raw(event.to_dict())
 """
 
+import datetime
 import logging
 import time
 from dataclasses import dataclass, field, asdict
@@ -38,6 +39,12 @@ from pipeline.dtw_matcher import DTWMatcher
 logger = logging.getLogger(__name__)
 
 
+def _utc_iso() -> str:
+    """Current UTC time as an ISO-8601 'Z' string (same wire format as the
+    old strftime call, without the format-string parse per invocation)."""
+    return datetime.datetime.utcnow().isoformat(timespec="seconds") + "Z"
+
+
 #Rcording Session State Machine 
 
 class RecordingState(Enum):
@@ -73,6 +80,7 @@ class Recorder:
     DYNAMIC_CAPTURE_SECONDS = 1.0
     BETWEEN_REST_SECONDS    = 2.0
     TARGET_SAMPLES          = 6      # 5–7; we use 6
+    FRAME_BUF_CAPACITY      = 128    # longest window (2s) at ~60fps, with headroom
 
     def __init__(self, config: ConfigManager, dtw: DTWMatcher):
         self.cfg = config
@@ -83,8 +91,17 @@ class Recorder:
         self._gesture_type  = "static"  # "static" | "dynamic"
         self._preferred_hand = "Right"
         self._samples:      list[dict] = []
-        self._frame_buffer: list[np.ndarray] = []   # for dynamic recording
+        # Preallocated capture buffer — frames are written in place instead of
+        # appending copies to a growing list, so the median/DTW math in the
+        # capture handlers runs over one contiguous C-order array.
+        self._frame_buf = np.empty((self.FRAME_BUF_CAPACITY, 21, 3), dtype=np.float32)
+        self._frame_len = 0
+        # Internal timing is monotonic (immune to NTP/DST wall-clock jumps);
+        # the end of each timed state is precomputed as an absolute deadline
+        # at transition time, so update() does one clock read and one compare
+        # per frame instead of recomputing elapsed everywhere.
         self._state_start   = 0.0
+        self._deadline      = 0.0
         self._last_capture  = 0.0
         self._countdown_val = self.COUNTDOWN_SECONDS
 
@@ -110,7 +127,7 @@ class Recorder:
         self._gesture_type   = gesture_type
         self._preferred_hand = preferred_hand
         self._samples        = []
-        self._frame_buffer   = []
+        self._frame_len      = 0
         self._transition(RecordingState.COUNTDOWN)
         logger.info(f"Recording session started: {gesture_id} ({gesture_type})")
 
@@ -135,6 +152,10 @@ class Recorder:
         """
         Call every frame. Returns a RecordingEvent if something noteworthy
         happened (state change, sample saved, complete), else None.
+
+        At most one event is emitted per call (states advance one step per
+        frame), and consecutive events are always ≥1s apart — so there is
+        never a burst worth coalescing into a batched WebSocket frame.
         """
         if self._state == RecordingState.IDLE:
             return None
@@ -142,12 +163,11 @@ class Recorder:
         hand = frame_result.hands.get(self._preferred_hand) or \
                next(iter(frame_result.hands.values()), None)
 
-        now = time.time()
+        now = time.monotonic()
 
         #  COUNTDOWN
         if self._state == RecordingState.COUNTDOWN:
-            elapsed  = now - self._state_start
-            remaining = self.COUNTDOWN_SECONDS - int(elapsed)
+            remaining = self.COUNTDOWN_SECONDS - int(now - self._state_start)
             if remaining <= 0:
                 self._transition(RecordingState.CAPTURING)
                 return RecordingEvent(
@@ -175,19 +195,16 @@ class Recorder:
             if hand is None:
                 return None   # wait for hand to appear
 
-            elapsed = now - self._state_start
-
             if self._gesture_type == "static":
-                event = self._capture_static(hand.landmarks, elapsed, now)
+                event = self._capture_static(hand.landmarks, now)
             else:
-                event = self._capture_dynamic(hand.landmarks, elapsed)
+                event = self._capture_dynamic(hand.landmarks, now)
 
             return event
 
         #  BETWEEN
         if self._state == RecordingState.BETWEEN:
-            elapsed = now - self._state_start
-            if elapsed >= self.BETWEEN_REST_SECONDS:
+            if now >= self._deadline:
                 self._countdown_val = self.COUNTDOWN_SECONDS
                 self._transition(RecordingState.COUNTDOWN)
                 return RecordingEvent(
@@ -202,23 +219,41 @@ class Recorder:
 
         return None
 
+    #  Frame Buffer
+
+    def _push_frame(self, landmarks: np.ndarray):
+        """
+        Write one (21,3) landmark frame into the preallocated buffer.
+
+        The slice assignment is the only copy made — no per-frame ndarray
+        allocation — and it keeps the recorder safe even when the detector
+        hands back the same array on inference-skipped frames.
+        """
+        if self._frame_len < self.FRAME_BUF_CAPACITY:
+            self._frame_buf[self._frame_len] = landmarks
+            self._frame_len += 1
+
     #  Static Capture
 
     def _capture_static(
-        self, landmarks: np.ndarray, elapsed: float, now: float
+        self, landmarks: np.ndarray, now: float
     ) -> Optional[RecordingEvent]:
         """
         During the 2s capture window, snap a sample every STATIC_SAMPLE_INTERVAL.
         One full run = 1 sample (the median frame of the window, for robustness).
         """
-        self._frame_buffer.append(landmarks.copy())
-
-        if elapsed >= self.STATIC_CAPTURE_SECONDS:
+        # Only buffer a frame at each sample tick — 5 frames per window
+        # instead of every capture-loop frame (~60), so the median at the end
+        # sorts a fraction of the data for the same hold-still robustness
+        if now - self._last_capture >= self.STATIC_SAMPLE_INTERVAL:
+            self._push_frame(landmarks)
+            self._last_capture = now
+
+        if now >= self._deadline:
             # Take the median frame (most representative)
-            stacked = np.stack(self._frame_buffer, axis=0)
-            median_frame = np.median(stacked, axis=0)
+            median_frame = np.median(self._frame_buf[:self._frame_len], axis=0)
             sample = {
-                "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "recorded_at": _utc_iso(),
                 "landmarks": self.dtw.prepare_static_sample(median_frame)
             }
             return self._save_sample(sample)
@@ -228,17 +263,17 @@ class Recorder:
     #  Dynamic Capture
 
     def _capture_dynamic(
-        self, landmarks: np.ndarray, elapsed: float
+        self, landmarks: np.ndarray, now: float
     ) -> Optional[RecordingEvent]:
         """
         Record every frame for 1 second, then store the whole sequence as one sample.
         """
-        self._frame_buffer.append(landmarks.copy())
+        self._push_frame(landmarks)
 
-        if elapsed >= self.DYNAMIC_CAPTURE_SECONDS:
+        if now >= self._deadline:
             sample = {
-                "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                "landmarks": self.dtw.prepare_dynamic_sample(self._frame_buffer)
+                "recorded_at": _utc_iso(),
+                "landmarks": self.dtw.prepare_dynamic_sample(self._frame_buf[:self._frame_len])
             }
             return self._save_sample(sample)
 
@@ -248,7 +283,7 @@ class Recorder:
 
     def _save_sample(self, sample: dict) -> RecordingEvent:
         self._samples.append(sample)
-        self._frame_buffer = []
+        self._frame_len = 0
         logger.info(
             f"Sample {len(self._samples)}/{self.TARGET_SAMPLES} saved for {self._gesture_id}"
         )
@@ -267,7 +302,6 @@ class Recorder:
 
     def _finalise(self) -> RecordingEvent:
         """All samples collected — persist the gesture."""
-        import datetime
         gesture_data = {
             "label":       self._label,
             "type":        self._gesture_type,
@@ -305,6 +339,18 @@ class Recorder:
 
     def _transition(self, new_state: RecordingState):
         logger.debug(f"Recording: {self._state.name} → {new_state.name}")
+        now = time.monotonic()
         self._state       = new_state
-        self._state_start = time.time()
-        self._frame_buffer = []
+        self._state_start = now
+        if new_state == RecordingState.COUNTDOWN:
+            self._deadline = now + self.COUNTDOWN_SECONDS
+        elif new_state == RecordingState.CAPTURING:
+            self._deadline = now + (
+                self.STATIC_CAPTURE_SECONDS
+                if self._gesture_type == "static"
+                else self.DYNAMIC_CAPTURE_SECONDS
+            )
+        elif new_state == RecordingState.BETWEEN:
+            self._deadline = now + self.BETWEEN_REST_SECONDS
+        self._frame_len   = 0
+        self._last_capture = 0.0   # first sample tick fires immediately
@@ -61,6 +61,20 @@ class GestureTaskMapper:
 
     def __init__(self, cfg: ConfigManager):
         self._cfg = cfg
+        # Resolved binding cache: the "none"/"_"-comment filtering and the
+        # INDEX_ONLY override are applied once per config change, so the
+        # per-gesture-per-frame lookup in get_task is a single dict get.
+        # Keyed on the config version counter (same scheme as the snapshot
+        # and template caches); every mutator routes through ConfigManager,
+        # which bumps the counter.
+        self._cache: dict[str, str] = {}
+        self._cache_version = -1
+        # Catalog memo — all_mappings/gesture_catalog/task_catalog rebuild
+        # filtered dicts on every UI poll; cache them under the same version
+        # key. Cached dicts are returned as-is and must be treated as
+        # read-only by callers (they only get serialised to JSON).
+        self._catalogs: dict[str, dict] = {}
+        self._catalog_version = -1
         logger.info("GestureTaskMapper initialised.")
 
     # ── Core Mapping ────────────────────────────────────────────────────────────
@@ -77,14 +91,21 @@ class GestureTaskMapper:
         Binding = "none" (or missing) -> nothing fires.
         GestureRouter calls this once per detected gesture per frame.
         """
+        if self._cache_version != self._cfg.version:
+            self._rebuild_cache()
+        return self._cache.get(gesture_id)
+
+    def _rebuild_cache(self) -> None:
+        """Resolve all bindings into a flat gesture_id → task_id dict."""
+        resolved: dict[str, str] = {}
+        for gid, raw in self._cfg.bindings.items():
+            if raw is None or raw == "none" or str(raw).startswith("_"):
+                continue   # unmapped — .get() returns None
+            resolved[gid] = raw
         # HARDCODED: INDEX_ONLY MUST be area_screenshot_drag (unmappable)
-        if gesture_id == "INDEX_ONLY":
-            return "area_screenshot_drag"
-
-        raw = self._cfg.get("bindings", gesture_id)
-        if raw is None or raw == "none" or str(raw).startswith("_"):
-            return None
-        return raw
+        resolved["INDEX_ONLY"] = "area_screenshot_drag"
+        self._cache = resolved
+        self._cache_version = self._cfg.version
 
     # ── Mutation ────────────────────────────────────────────────────────────────
 
@@ -118,46 +139,56 @@ class GestureTaskMapper:
         Custom gesture bindings are left unchanged.
         Called by WebSocket RESET_BINDINGS handler.
         """
-        with self._cfg._lock:
-            existing: dict = self._cfg._config.setdefault("bindings", {})
-            for gid, tid in self.DEFAULT_BINDINGS.items():
-                existing[gid] = tid
-        self._cfg.save()
+        # One version bump for the whole batch, so every version-keyed cache
+        # (router bindings, snapshot, the memos below) picks up the reset
+        self._cfg.update_bindings(self.DEFAULT_BINDINGS)
         logger.info("All built-in bindings reset to factory defaults.")
 
     # ── Catalogs ────────────────────────────────────────────────────────────────
 
+    def _catalog(self, name: str, build) -> dict:
+        """Version-keyed memo around the catalog builders below."""
+        if self._catalog_version != self._cfg.version:
+            self._catalogs.clear()
+            self._catalog_version = self._cfg.version
+        cached = self._catalogs.get(name)
+        if cached is None:
+            cached = self._catalogs[name] = build()
+        return cached
+
     def all_mappings(self) -> dict[str, str]:
         """Return all current gesture→task pairs (skips comment keys)."""
-        return {
+        return self._catalog("mappings", lambda: {
             k: v for k, v in self._cfg.bindings.items()
             if not k.startswith("_") and isinstance(v, str)
-        }
+        })
 
     def gesture_catalog(self) -> dict:
         """
         Full list of recognisable gestures (built-in + custom).
         Each entry: { label, type, hand, enabled, description }
         """
-        gestures = {
-            k: v for k, v in self._cfg.gestures.items()
-            if not k.startswith("_")
-        }
-        custom = {
-            k: v for k, v in self._cfg.custom_gestures.items()
-            if not k.startswith("_")
-        }
-        return {**gestures, **custom}
+        def build():
+            gestures = {
+                k: v for k, v in self._cfg.gestures.items()
+                if not k.startswith("_")
+            }
+            custom = {
+                k: v for k, v in self._cfg.custom_gestures.items()
+                if not k.startswith("_")
+            }
+            return {**gestures, **custom}
+        return self._catalog("gestures", build)
 
     def task_catalog(self) -> dict:
         """
         Full list of executable tasks (actions).
         Each entry: { label, type, shortcut, ... }
         """
-        return {
+        return self._catalog("tasks", lambda: {
             k: v for k, v in self._cfg.actions.items()
             if not k.startswith("_")
-        }
+        })
 
     def task_exists(self, task_id: str) -> bool:
         """Return True if task_id is a known action."""
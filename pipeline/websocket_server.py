@@ -39,19 +39,59 @@ Message protocol (both directions are JSON):
 
 import asyncio
 import json
+from collections import deque
 import logging
 import threading
 import time
 from typing import Optional
 
 import websockets
+from websockets import broadcast as ws_broadcast
 from websockets.server import WebSocketServerProtocol
 
 from pipeline.config_manager import ConfigManager
 from pipeline.gesture_router import ActionEvent
 
+try:
+    import orjson          # serialises ndarray meta (landmarks) natively in C
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop          # libuv event loop — lower per-message overhead
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+# Inbound messages larger than this are rejected before parsing. The biggest
+# legitimate message is SAVE_CUSTOM_GESTURE with ~6 dynamic samples of ~30
+# frames (~250 KB as JSON text); anything past half a megabyte is a
+# misbehaving client, and parsing it would balloon custom_gestures.
+_MAX_INBOUND_BYTES = 512 * 1024
+
+
+def _json_default(obj):
+    """stdlib-json fallback for ndarray values in event meta."""
+    tolist = getattr(obj, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    raise TypeError(f"Not JSON serialisable: {type(obj)}")
+
+
+if orjson is not None:
+    def _dumps(doc: dict) -> str:
+        # decode(): websockets must see str so the frame goes out as text,
+        # not binary (the extension's onmessage expects text frames)
+        return orjson.dumps(doc, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    _loads = orjson.loads
+else:
+    def _dumps(doc: dict) -> str:
+        return json.dumps(doc, default=_json_default)
+
+    _loads = json.loads
+
 
 class WebSocketServer:
     """
@@ -72,9 +112,31 @@ class WebSocketServer:
         self._running  = False
 
         # FPS tracking for STATUS messages
-        self._frame_times: list[float] = []
+        self._frame_times: deque[float] = deque()
         self._last_status_broadcast = 0.0
 
+        # Serialised CONFIG_SNAPSHOT cache — the snapshot is the largest
+        # message we send (full settings/actions/gestures/bindings/customs)
+        # and goes out on every connect; re-serialise only when the config
+        # version counter moves.
+        self._snapshot_cache: Optional[str] = None
+        self._snapshot_version = -1
+
+        # Pending debounced config write (see _schedule_config_flush).
+        # Loop thread only.
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # Inbound dispatch table — one dict hash per message instead of a
+        # chain of string comparisons in _handle_inbound
+        self._inbound_handlers = {
+            "PING":                  self._on_ping,
+            "UPDATE_SETTING":        self._on_update_setting,
+            "UPDATE_BINDING":        self._on_update_binding,
+            "SAVE_CUSTOM_GESTURE":   self._on_save_custom_gesture,
+            "DELETE_CUSTOM_GESTURE": self._on_delete_custom_gesture,
+            "GET_CONFIG":            self._on_get_config,
+        }
+
     # ── Lifecycle ──────────────────────────────────────────────────────────────
 
     def start(self):
@@ -88,12 +150,19 @@ class WebSocketServer:
             name="WebSocketServer"
         )
         self._thread.start()
-        logger.info(f"WebSocket server starting on ws://{self.cfg.ws_host}:{self.cfg.ws_port}")
+        logger.info("WebSocket server starting on ws://%s:%s", self.cfg.ws_host, self.cfg.ws_port)
 
     def stop(self):
         self._running = False
         if self._loop:
-            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop.call_soon_threadsafe(self._shutdown)
+
+    def _shutdown(self):
+        """Flush any pending config write, then stop the loop. Loop thread only."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_config()
+        self._loop.stop()
 
     # ── Broadcasting (thread-safe, called from OpenCV thread) ─────────────────
 
@@ -101,49 +170,63 @@ class WebSocketServer:
         """
         Send an ActionEvent to all connected extension clients.
         Thread-safe — schedules on the asyncio loop.
+
+        Sent immediately, one frame per event: actions are cooldown-limited
+        to a few per second upstream, so a coalescing flush timer would only
+        add latency to user-visible actions, never amortise anything.
         """
         if not self._loop or not self._clients:
             return
-        payload = json.dumps({"type": "ACTION", **event.to_dict()})
-        asyncio.run_coroutine_threadsafe(
-            self._broadcast_raw(payload), self._loop
-        )
+        # OPT_SERIALIZE_NUMPY lets meta carry raw landmark ndarrays —
+        # the wire format is still plain JSON arrays
+        payload = _dumps(event.to_dict())
+        # Plain callback hop — no coroutine or Future allocation per event
+        self._loop.call_soon_threadsafe(self._fanout, payload)
 
     def broadcast_status(self, status: str):
         """Send a STATUS heartbeat. Called from the pipeline loop."""
         if not self._loop or not self._clients:
             return
-        now = time.time()
-
-        # FPS calculation
-        self._frame_times.append(now)
-        self._frame_times = [t for t in self._frame_times if now - t < 1.0]
-        fps = len(self._frame_times)
-
-        # Rate-limit status messages to once per second
+        # Monotonic clock for interval math — immune to NTP/DST wall-clock
+        # jumps that would distort the FPS window or stall the rate limiter
+        now = time.monotonic()
+
+        # Record the frame, then rate-limit before doing any more work —
+        # at 30+ FPS all but one call per second returns right here
+        frame_times = self._frame_times
+        frame_times.append(now)
         if now - self._last_status_broadcast < 1.0:
             return
         self._last_status_broadcast = now
 
-        payload = json.dumps({
+        # FPS = frames recorded in the trailing second; stale entries are
+        # popped from the left (amortised O(1)) instead of rebuilding a list
+        while frame_times and now - frame_times[0] >= 1.0:
+            frame_times.popleft()
+        fps = len(frame_times)
+
+        payload = _dumps({
             "type": "STATUS",
             "status": status,
             "fps": fps,
-            "timestamp": now
+            "timestamp": time.time()   # wire timestamp stays wall-clock
         })
-        asyncio.run_coroutine_threadsafe(
-            self._broadcast_raw(payload), self._loop
-        )
+        self._loop.call_soon_threadsafe(self._fanout, payload)
 
     # ── Async internals ────────────────────────────────────────────────────────
 
     def _run_loop(self):
-        self._loop = asyncio.new_event_loop()
+        # uvloop is a drop-in AbstractEventLoop; everything else (threadsafe
+        # call-ins, websockets.serve) is loop-implementation agnostic
+        self._loop = (
+            uvloop.new_event_loop() if uvloop is not None
+            else asyncio.new_event_loop()
+        )
         asyncio.set_event_loop(self._loop)
         try:
             self._loop.run_until_complete(self._serve())
         except Exception as e:
-            logger.error(f"WebSocket loop error: {e}")
+            logger.error("WebSocket loop error: %s", e)
 
     async def _serve(self):
         async with websockets.serve(
@@ -152,15 +235,25 @@ class WebSocketServer:
             self.cfg.ws_port,
             ping_interval=20,
             ping_timeout=10,
+            # Localhost IPC: permessage-deflate just burns zlib CPU on every
+            # frame for bandwidth nobody is short of
+            compression=None,
+            # 1 MB caps cover the largest message either way (config
+            # snapshots with recorded landmark samples); the raised
+            # write_limit keeps broadcast bursts from hitting flow control
+            max_size=2**20,
+            write_limit=2**20,
         ):
-            logger.info(f"WebSocket server live on ws://{self.cfg.ws_host}:{self.cfg.ws_port}")
+            logger.info("WebSocket server live on ws://%s:%s", self.cfg.ws_host, self.cfg.ws_port)
             await asyncio.Future()   # run forever until loop is stopped
 
     async def _handler(self, websocket: WebSocketServerProtocol):
         """Handle a new client connection."""
-        client_id = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
+        # Read remote_address once — it queries the transport per access —
+        # and leave the formatting to the logger
+        addr = websocket.remote_address
         self._clients.add(websocket)
-        logger.info(f"Client connected: {client_id}  (total: {len(self._clients)})")
+        logger.info("Client connected: %s:%s  (total: %d)", addr[0], addr[1], len(self._clients))
 
         # Send current config snapshot on connect
         await self._send_config_snapshot(websocket)
@@ -172,80 +265,114 @@ class WebSocketServer:
             pass
         finally:
             self._clients.discard(websocket)
-            logger.info(f"Client disconnected: {client_id}  (total: {len(self._clients)})")
+            logger.info("Client disconnected: %s:%s  (total: %d)", addr[0], addr[1], len(self._clients))
 
-    async def _broadcast_raw(self, payload: str):
-        """Send raw JSON string to all connected clients."""
-        if not self._clients:
-            return
-        dead = set()
-        for ws in self._clients:
-            try:
-                await ws.send(payload)
-            except websockets.ConnectionClosed:
-                dead.add(ws)
-        self._clients -= dead
+    def _fanout(self, payload: str):
+        """
+        Write one payload to every connected client. Loop thread only.
+
+        websockets.broadcast frames the message once and pushes the same
+        buffer into each transport's write queue synchronously — no
+        per-client coroutine, no awaiting, and closed/stalled sockets are
+        skipped internally (the handler's finally block prunes them).
+        """
+        if self._clients:
+            ws_broadcast(self._clients, payload)
+
+    def broadcast_raw(self, payload: str):
+        """Send a pre-serialised JSON string to all clients. Thread-safe."""
+        if self._loop and self._clients:
+            self._loop.call_soon_threadsafe(self._fanout, payload)
 
     # ── Inbound Message Handling ───────────────────────────────────────────────
 
     async def _handle_inbound(self, websocket: WebSocketServerProtocol, raw: str):
+        if len(raw) > _MAX_INBOUND_BYTES:
+            logger.warning("Oversized inbound message rejected (%d bytes)", len(raw))
+            await websocket.send(_dumps({"type": "ERROR", "error": "message_too_large"}))
+            return
         try:
-            msg = json.loads(raw)
-        except json.JSONDecodeError:
-            logger.warning(f"Invalid JSON from client: {raw[:80]}")
+            msg = _loads(raw)
+        except ValueError:
+            logger.warning("Invalid JSON from client: %.80s", raw)
             return
 
-        msg_type = msg.get("type")
-
-        if msg_type == "PING":
-            await websocket.send(json.dumps({"type": "PONG", "timestamp": time.time()}))
-
-        elif msg_type == "UPDATE_SETTING":
-            key   = msg.get("key")
-            value = msg.get("value")
-            if key and value is not None:
-                self.cfg.set_setting(key, value)
-                logger.info(f"Setting updated via WS: {key}={value}")
-                await websocket.send(json.dumps({"type": "ACK", "key": key, "value": value}))
-
-        elif msg_type == "UPDATE_BINDING":
-            gid = msg.get("gesture_id")
-            aid = msg.get("action_id")
-            if gid and aid:
-                self.cfg.set_binding(gid, aid)
-                logger.info(f"Binding updated via WS: {gid}→{aid}")
-                await websocket.send(json.dumps({"type": "ACK", "gesture_id": gid, "action_id": aid}))
-
-        elif msg_type == "SAVE_CUSTOM_GESTURE":
-            gid  = msg.get("gesture_id")
-            data = msg.get("data")
-            if gid and data:
-                self.cfg.save_custom_gesture(gid, data)
-                await websocket.send(json.dumps({"type": "ACK", "gesture_id": gid, "saved": True}))
-
-        elif msg_type == "DELETE_CUSTOM_GESTURE":
-            gid = msg.get("gesture_id")
-            if gid:
-                self.cfg.delete_custom_gesture(gid)
-                await websocket.send(json.dumps({"type": "ACK", "gesture_id": gid, "deleted": True}))
-
-        elif msg_type == "GET_CONFIG":
-            await self._send_config_snapshot(websocket)
-
+        handler = self._inbound_handlers.get(msg.get("type"))
+        if handler is not None:
+            await handler(websocket, msg)
         else:
-            logger.warning(f"Unknown inbound message type: {msg_type}")
+            logger.warning("Unknown inbound message type: %s", msg.get("type"))
+
+    async def _on_ping(self, websocket: WebSocketServerProtocol, msg: dict):
+        await websocket.send(_dumps({"type": "PONG", "timestamp": time.time()}))
+
+    async def _on_update_setting(self, websocket: WebSocketServerProtocol, msg: dict):
+        key   = msg.get("key")
+        value = msg.get("value")
+        if key and value is not None:
+            # In-memory update only; the disk write is debounced so a slider
+            # drag (dozens of UPDATE_SETTINGs per second) costs one save
+            self.cfg.set("settings", key, value, persist=False)
+            self._schedule_config_flush()
+            logger.info("Setting updated via WS: %s=%s", key, value)
+            await websocket.send(_dumps({"type": "ACK", "key": key, "value": value}))
+
+    async def _on_update_binding(self, websocket: WebSocketServerProtocol, msg: dict):
+        gid = msg.get("gesture_id")
+        aid = msg.get("action_id")
+        if gid and aid:
+            self.cfg.set("bindings", gid, aid, persist=False)
+            self._schedule_config_flush()
+            logger.info("Binding updated via WS: %s→%s", gid, aid)
+            await websocket.send(_dumps({"type": "ACK", "gesture_id": gid, "action_id": aid}))
+
+    async def _on_save_custom_gesture(self, websocket: WebSocketServerProtocol, msg: dict):
+        gid  = msg.get("gesture_id")
+        data = msg.get("data")
+        if gid and data:
+            self.cfg.save_custom_gesture(gid, data)
+            await websocket.send(_dumps({"type": "ACK", "gesture_id": gid, "saved": True}))
+
+    async def _on_delete_custom_gesture(self, websocket: WebSocketServerProtocol, msg: dict):
+        gid = msg.get("gesture_id")
+        if gid:
+            self.cfg.delete_custom_gesture(gid)
+            await websocket.send(_dumps({"type": "ACK", "gesture_id": gid, "deleted": True}))
+
+    async def _on_get_config(self, websocket: WebSocketServerProtocol, msg: dict):
+        await self._send_config_snapshot(websocket)
+
+    def _schedule_config_flush(self):
+        """
+        Coalesce config writes: mutations from UPDATE_SETTING/UPDATE_BINDING
+        land in memory immediately (the version counter bumps, so caches and
+        snapshots see them), and the disk write happens once 250 ms after the
+        first mutation rather than per message. Loop thread only.
+        """
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(0.25, self._flush_config)
+
+    def _flush_config(self):
+        self._flush_handle = None
+        self.cfg.save()
 
     async def _send_config_snapshot(self, websocket: WebSocketServerProtocol):
-        """Push the full current config to a newly connected client."""
-        snapshot = {
-            "type": "CONFIG_SNAPSHOT",
-            "settings": self.cfg.settings,
-            "actions":  self.cfg.actions,
-            "gestures": self.cfg.gestures,
-            "bindings": self.cfg.bindings,
-            "custom_gestures": self.cfg.custom_gestures,
-        }
-        await websocket.send(json.dumps(snapshot))
+        """
+        Push the full current config to a newly connected client.
+
+        Deliberately one message rather than per-section events: the
+        extension's background.js and the dashboard both consume a single
+        CONFIG_SNAPSHOT atomically, and the serialised payload is cached
+        (version-keyed, shared by every connect) so per-connection cost is
+        one send of an already-built string — splitting it would change the
+        wire protocol for no memory win.
+        """
+        if self._snapshot_cache is None or self._snapshot_version != self.cfg.version:
+            self._snapshot_version = self.cfg.version
+            self._snapshot_cache = _dumps(
+                {"type": "CONFIG_SNAPSHOT", **self.cfg.snapshot_dict()}
+            )
+        await websocket.send(self._snapshot_cache)
 
     @property
     def client_count(self) -> int:
@@ -13,13 +13,14 @@ The extension calls:
     GET  http://localhost:8766/status  → {"running": true/false, "pid": N}
 """
 
+import gzip
 import json
 import logging
 import os
 import subprocess
 import sys
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 # ── Config ─────────────────────────────────────────────────────────────────────
@@ -29,6 +30,7 @@ PROJECT_ROOT = Path(__file__).parent.resolve()
 VENV_PYTHON  = PROJECT_ROOT / "venv" / "Scripts" / "pythonw.exe"
 MAIN_PY      = PROJECT_ROOT / "main.py"
 LOG_FILE     = PROJECT_ROOT / "pipeline.log"
+CONFIG_PATH  = PROJECT_ROOT / "gestures_config_v2.json"
 
 logging.basicConfig(
     level=logging.INFO,
@@ -42,10 +44,19 @@ logger = logging.getLogger("watchdog")
 _process: subprocess.Popen | None = None
 _lock = threading.Lock()
 
+# /config response cache keyed on the file's mtime_ns: (mtime, raw bytes,
+# gzipped bytes or None). The popup can poll aggressively; revalidating is
+# one stat() instead of a read + gzip per request. Rebinding the tuple is
+# atomic under the GIL, so handler threads need no lock around it.
+_cfg_cache: tuple[int, bytes, bytes | None] | None = None
 
-def is_running() -> bool:
+
+def status_snapshot() -> tuple[bool, int | None]:
+    """Return (running, pid) from a single lock-scoped read of _process."""
     with _lock:
-        return _process is not None and _process.poll() is None
+        if _process is not None and _process.poll() is None:
+            return True, _process.pid
+        return False, None
 
 
 def start_pipeline() -> dict:
@@ -55,22 +66,29 @@ def start_pipeline() -> dict:
             return {"ok": True, "status": "already_running", "pid": _process.pid}
 
         python_exe = str(VENV_PYTHON) if VENV_PYTHON.exists() else sys.executable
-        log_handle = open(LOG_FILE, "a", encoding="utf-8")
+        # Raw append-mode fd instead of a Python text handle: the child
+        # inherits the descriptor directly, so log lines hit the file without
+        # a parent-side buffer (the old handle was never closed and its
+        # buffered tail could lag the crash it was meant to explain).
+        log_fd = os.open(LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
 
-        import os as _os
-        env = _os.environ.copy()
+        env = os.environ.copy()
         env["PYTHONIOENCODING"] = "utf-8"
         env["PYTHONUTF8"]       = "1"
 
-        _process = subprocess.Popen(
-            [python_exe, str(MAIN_PY), "--no-preview"],
-            cwd=str(PROJECT_ROOT),
-            stdout=log_handle,
-            stderr=log_handle,
-            env=env,
-            # No console window on Windows
-            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-        )
+        try:
+            _process = subprocess.Popen(
+                [python_exe, str(MAIN_PY), "--no-preview"],
+                cwd=str(PROJECT_ROOT),
+                stdout=log_fd,
+                stderr=log_fd,
+                env=env,
+                # No console window on Windows
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+            )
+        finally:
+            # Popen duplicated the fd into the child; the parent's copy is done
+            os.close(log_fd)
         logger.info(f"Pipeline started (PID {_process.pid})")
         return {"ok": True, "status": "started", "pid": _process.pid}
 
@@ -117,18 +135,36 @@ class WatchdogHandler(BaseHTTPRequestHandler):
 
     def do_GET(self):
         if self.path == "/status":
-            running = is_running()
-            pid     = _process.pid if running and _process else None
+            running, pid = status_snapshot()
             self._send_json(200, {"running": running, "pid": pid})
         elif self.path == "/config":
             # Serve the gestures config so the popup can load gestures/actions
-            # without needing an active WebSocket connection
-            config_path = PROJECT_ROOT / "gestures_config_v2.json"
+            # without needing an active WebSocket connection. The file is
+            # already JSON (and written atomically by ConfigManager.save), so
+            # stream the raw bytes instead of parsing and re-serialising the
+            # landmark-heavy document on every request.
+            global _cfg_cache
             try:
-                with open(config_path, encoding="utf-8") as f:
-                    import json as _json
-                    data = _json.load(f)
-                self._send_json(200, data)
+                mtime = CONFIG_PATH.stat().st_mtime_ns
+                cache = _cfg_cache
+                if cache is None or cache[0] != mtime:
+                    raw = CONFIG_PATH.read_bytes()
+                    # JSON with repeated keys and landmark arrays compresses
+                    # 5-10x; only bother for payloads past a packet's worth.
+                    # Compressed once here, served many times from the cache.
+                    gz = gzip.compress(raw, compresslevel=6) if len(raw) > 1024 else None
+                    cache = _cfg_cache = (mtime, raw, gz)
+                _, payload, gz = cache
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                if gz is not None and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    payload = gz
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(payload)))
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+                self.end_headers()
+                self.wfile.write(payload)
             except FileNotFoundError:
                 self._send_json(404, {"error": "Config not found"})
         else:
@@ -150,7 +186,11 @@ class WatchdogHandler(BaseHTTPRequestHandler):
 def main():
     logger.info(f"Watchdog listening on http://localhost:{PORT}")
     logger.info(f"Project: {PROJECT_ROOT}")
-    server = HTTPServer(("localhost", PORT), WatchdogHandler)
+    # ThreadingHTTPServer: a slow or stalled client (e.g. the popup polling
+    # /status over a flaky connection) must not block /start and /stop.
+    # Handlers stay safe — pipeline state is guarded by _lock.
+    server = ThreadingHTTPServer(("localhost", PORT), WatchdogHandler)
+    server.daemon_threads = True
     try:
         server.serve_forever()
     except KeyboardInterrupt: